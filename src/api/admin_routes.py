@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 
 from src.config.settings import MemoryType
 from src.models.memory_models import SystemStats
-from src.service.memory_facade import MemoryFacadeService
+from src.service.memory_facade import MemoryFacadeService, get_memory_facade
 
 router = APIRouter(
     prefix="/api/admin", 
@@ -21,16 +21,6 @@ router = APIRouter(
     }
 )
 
-# 의존성 주입 - 싱글톤 패턴
-_memory_facade = None
-
-def get_memory_facade() -> MemoryFacadeService:
-    """메모리 Facade 의존성 (싱글톤)"""
-    global _memory_facade
-    if _memory_facade is None:
-        _memory_facade = MemoryFacadeService()
-    return _memory_facade
-
 
 @router.post("/collections/{memory_type}/reset")
 async def reset_collection(
@@ -296,6 +286,7 @@ async def get_current_configuration():
             "database": {
                 "qdrant_host": db_config.qdrant_host,
                 "qdrant_port": db_config.qdrant_port,
+                "qdrant_prefer_grpc": db_config.qdrant_prefer_grpc,
                 "vector_dim": db_config.vector_dim
             },
             "embedding": {
@@ -306,7 +297,10 @@ async def get_current_configuration():
             "collections": {
                 "episodic_vector_dim": collection_config.episodic_vector_dim,
                 "semantic_vector_dim": collection_config.semantic_vector_dim,
-                "auto_create_collections": collection_config.auto_create_collections
+                "auto_create_collections": collection_config.auto_create_collections,
+                "quantization_type": collection_config.quantization_type,
+                "vector_datatype": collection_config.vector_datatype,
+                "hnsw_ef": collection_config.hnsw_ef
             },
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
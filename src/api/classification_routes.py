@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Optional, Dict, Any
 
 from src.models.memory_models import ClassificationResult
-from src.service.memory_facade import MemoryFacadeService
+from src.service.memory_facade import MemoryFacadeService, get_memory_facade
 
 router = APIRouter(
     prefix="/api/classify", 
@@ -19,16 +19,6 @@ router = APIRouter(
     }
 )
 
-# 의존성 주입 - 싱글톤 패턴
-_memory_facade = None
-
-def get_memory_facade() -> MemoryFacadeService:
-    """메모리 Facade 의존성 (싱글톤)"""
-    global _memory_facade
-    if _memory_facade is None:
-        _memory_facade = MemoryFacadeService()
-    return _memory_facade
-
 
 @router.post("/", response_model=ClassificationResult)
 async def classify_text(
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, Header, Query, HTTPException
 from typing import List, Dict, Any
-from datetime import datetime, timezone
 
 from src.config.settings import MemoryType
 from src.models.memory_models import (
     MemoryInsertRequest, MemoryInsertResponse, MemorySearchResult, 
-    MultiCollectionSearchResponse
+    MultiCollectionSearchResponse, MemoryContent,
+    MemoryBatchInsertRequest, MemoryBatchInsertResponse
 )
-from src.service.memory_facade import MemoryFacadeService
+from src.service.memory_facade import MemoryFacadeService, get_memory_facade
 
 router = APIRouter(
     prefix="/api", 
@@ -19,14 +19,61 @@ router = APIRouter(
     }
 )
 
-_memory_facade = None
 
-def get_memory_facade() -> MemoryFacadeService:
-    """메모리 Facade 의존성 (싱글톤)"""
-    global _memory_facade
-    if _memory_facade is None:
-        _memory_facade = MemoryFacadeService()
-    return _memory_facade
+@router.post(
+    "/memory/batch",
+    response_model=MemoryBatchInsertResponse,
+    summary="메모리 배치 삽입",
+    description="""
+    여러 메모리를 한 번에 삽입합니다. 임베딩은 한 번의 배치 요청으로 생성하고,
+    컬렉션별로 한 번씩 저장합니다. memory_type을 생략하면 항목별로 자동 분류합니다.
+    """
+)
+async def insert_memory_batch(
+    request: MemoryBatchInsertRequest,
+    facade: MemoryFacadeService = Depends(get_memory_facade)
+):
+    """메모리 배치 삽입 - 비즈니스 로직은 Service에 위임"""
+    try:
+        # HTTP 요청 검증
+        if any(not memory.text.strip() for memory in request.memories):
+            raise HTTPException(status_code=400, detail="텍스트가 비어있는 항목이 있습니다.")
+        
+        results = await facade.insert_memory_batch_async(
+            texts=[memory.text for memory in request.memories],
+            user_id=request.user_id,
+            metadatas=[_build_metadata_from_request(memory) for memory in request.memories],
+            memory_type=request.memory_type
+        )
+        
+        # HTTP 응답 변환
+        collection_stats = {}
+        for result in results:
+            collection_stats[result["memory_type"]] = collection_stats.get(result["memory_type"], 0) + 1
+        
+        return MemoryBatchInsertResponse(
+            results=[
+                MemoryInsertResponse(
+                    id=result["id"],
+                    memory_type=MemoryType(result["memory_type"]),
+                    collection_name=result["memory_type"],
+                    user_id=request.user_id,
+                    timestamp=result["timestamp"],
+                    classification_confidence=result.get("confidence"),
+                    classification_explanation=result.get("explanation")
+                )
+                for result in results
+            ],
+            total_inserted=len(results),
+            collection_stats=collection_stats
+        )
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"메모리 배치 삽입 실패: {str(e)}")
 
 
 @router.post(
@@ -54,7 +101,7 @@ async def insert_memory_by_type(
             raise HTTPException(status_code=400, detail="사용자 ID가 비어있습니다.")
         
         # 비즈니스 로직은 Service에 완전히 위임
-        result = facade.insert_memory_with_manual_type(
+        result = await facade.insert_memory_with_manual_type_async(
             text=request.text,
             user_id=request.user_id, 
             memory_type=memory_type,
@@ -67,7 +114,7 @@ async def insert_memory_by_type(
             memory_type=MemoryType(result["memory_type"]),
             collection_name=result["memory_type"],
             user_id=request.user_id,
-            timestamp=result.get("timestamp") or datetime.now(timezone.utc).isoformat()
+            timestamp=result["timestamp"]
         )
         
     except HTTPException:
@@ -100,7 +147,7 @@ async def insert_memory_auto_classify(
             raise HTTPException(status_code=400, detail="사용자 ID가 비어있습니다.")
         
         # 모든 비즈니스 로직을 Service에 위임
-        result = facade.insert_memory_with_auto_classification(
+        result = await facade.insert_memory_with_auto_classification_async(
             text=request.text,
             user_id=request.user_id,
             metadata=_build_metadata_from_request(request)
@@ -112,7 +159,7 @@ async def insert_memory_auto_classify(
             memory_type=MemoryType(result["memory_type"]),
             collection_name=result["memory_type"],
             user_id=request.user_id,
-            timestamp=result.get("timestamp"),
+            timestamp=result["timestamp"],
             classification_confidence=result.get("confidence"),
             classification_explanation=result.get("explanation")
         )
@@ -142,18 +189,13 @@ async def search_memory_by_type(
         if not user_id.strip():
             raise HTTPException(status_code=400, detail="사용자 ID 헤더가 필요합니다.")
         
-        # 검색 필터 구성 (HTTP 파라미터 → 비즈니스 로직 파라미터)
-        filters = {}
-        if similarity_threshold > 0:
-            filters["min_score"] = similarity_threshold
-        
-        # 비즈니스 로직은 Service에 위임
-        results = facade.search_memory_single_collection(
+        # 비즈니스 로직은 Service에 위임 (유사도 임계값은 Qdrant score_threshold로 전달)
+        results = await facade.search_memory_single_collection_async(
             query=query,
             user_id=user_id,
             memory_type=memory_type,
             limit=limit,
-            filters=filters
+            score_threshold=similarity_threshold or None
         )
         
         # 비즈니스 객체 → HTTP 응답 변환
@@ -165,6 +207,29 @@ async def search_memory_by_type(
         raise HTTPException(status_code=500, detail=f"검색 실패: {str(e)}")
 
 
+@router.get("/memory/{memory_type}/{memory_id}/similar", response_model=List[MemorySearchResult])
+async def search_similar_memories(
+    memory_type: MemoryType,
+    memory_id: str,
+    user_id: str = Header(..., alias="X-User-ID"),
+    limit: int = Query(default=10, ge=1, le=100),
+    facade: MemoryFacadeService = Depends(get_memory_facade)
+):
+    """저장된 메모리와 유사한 메모리 검색 - 임베딩 없이 저장 벡터 재사용"""
+    try:
+        if not user_id.strip():
+            raise HTTPException(status_code=400, detail="사용자 ID 헤더가 필요합니다.")
+        
+        results = await facade.search_similar_memories_async(memory_id, user_id, memory_type, limit)
+        
+        return [_convert_memory_point_to_search_result(result, memory_type) for result in results]
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"유사 메모리 검색 실패: {str(e)}")
+
+
 @router.get("/memory/search/multi", response_model=MultiCollectionSearchResponse)
 async def multi_collection_search(
     query: str,
@@ -186,7 +251,7 @@ async def multi_collection_search(
         
         # 비즈니스 로직 선택: 지능형 가중치 vs 수동 가중치
         if use_intelligent_weights:
-            result = facade.search_memory_intelligent(query, user_id, limit)
+            result = await facade.search_memory_intelligent_async(query, user_id, limit)
             search_results = result["results"]
             applied_weights = result.get("applied_weights", {})
             explanation = result.get("explanation", "")
@@ -196,7 +261,7 @@ async def multi_collection_search(
                 MemoryType.EPISODIC: episodic_weight,
                 MemoryType.SEMANTIC: semantic_weight
             }
-            search_results = facade.search_memory_multi_collection(
+            search_results = await facade.search_memory_multi_collection_async(
                 query, user_id, collections, limit, weights
             )
             applied_weights = {k.value: v for k, v in weights.items()}
@@ -227,7 +292,7 @@ async def multi_collection_search(
 
 
 
-def _build_metadata_from_request(request: MemoryInsertRequest) -> Dict[str, Any]:
+def _build_metadata_from_request(request: MemoryContent) -> Dict[str, Any]:
     """HTTP 요청을 비즈니스 로직용 메타데이터로 변환"""
     metadata = {}
     
@@ -258,46 +323,39 @@ def _build_metadata_from_request(request: MemoryInsertRequest) -> Dict[str, Any]
     return metadata
 
 
+# 타입별 특화 데이터로 응답에 포함할 payload 필드
+EPISODIC_DATA_FIELDS = ("speaker", "emotion", "context", "links")
+SEMANTIC_DATA_FIELDS = ("fact_type", "confidence_score", "last_updated")
+
+
 def _convert_memory_point_to_search_result(memory_point, memory_type=None) -> MemorySearchResult:
-    """비즈니스 객체를 HTTP 응답 객체로 변환"""
-    # memory_point의 실제 구조에 따라 구현
-    # 이는 MemoryPoint 모델의 정확한 구조를 알아야 함
+    """비즈니스 객체를 HTTP 응답 객체로 변환 (payload는 상위 결과에 대해서만 한 번 읽음)"""
+    metadata = getattr(memory_point, 'metadata', None) or {}
     
-    # 메모리 타입 결정
+    # 메모리 타입 결정 (다중 컬렉션 결과는 포인트의 컬렉션 타입 사용)
     if memory_type is None:
-        memory_type = getattr(memory_point, 'memory_type', MemoryType.SEMANTIC)
+        collection_type = getattr(memory_point, 'collection_type', None)
+        memory_type = MemoryType(collection_type) if collection_type else MemoryType.SEMANTIC
     
     # 타입별 특화 데이터 추출
     episodic_data = None
     semantic_data = None
     
-    if hasattr(memory_point, 'metadata'):
-        metadata = memory_point.metadata
-        
-        if memory_type == MemoryType.EPISODIC:
-            episodic_data = {
-                "speaker": metadata.get("speaker"),
-                "emotion": metadata.get("emotion"),
-                "context": metadata.get("context"),
-                "links": metadata.get("links")
-            }
-        elif memory_type == MemoryType.SEMANTIC:
-            semantic_data = {
-                "fact_type": metadata.get("fact_type"),
-                "confidence_score": metadata.get("confidence_score"),
-                "last_updated": metadata.get("last_updated")
-            }
+    if memory_type == MemoryType.EPISODIC:
+        episodic_data = {field: metadata.get(field) for field in EPISODIC_DATA_FIELDS}
+    elif memory_type == MemoryType.SEMANTIC:
+        semantic_data = {field: metadata.get(field) for field in SEMANTIC_DATA_FIELDS}
     
     return MemorySearchResult(
         id=str(getattr(memory_point, 'id', '')),
-        text=getattr(memory_point, 'text', ''),
+        text=metadata.get('text', ''),
         memory_type=memory_type,
         collection_name=memory_type.value,
-        score=getattr(memory_point, 'score', 0.0),
-        user_id=getattr(memory_point, 'user_id', ''),
-        timestamp=getattr(memory_point, 'timestamp', None),
-        importance_score=getattr(memory_point, 'importance_score', 0.5),
-        source=getattr(memory_point, 'source', ''),
+        score=getattr(memory_point, 'score', None) or 0.0,
+        user_id=metadata.get('user_id', ''),
+        timestamp=metadata.get('timestamp'),
+        importance_score=metadata.get('importance_score', 0.5),
+        source=metadata.get('source', ''),
         episodic_data=episodic_data,
         semantic_data=semantic_data
-    )
\ No newline at end of file
+    )
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from src.utils.system_info import SystemInfoCollector
+from src.infra.embedding import get_embedding_cache_stats
 from datetime import datetime
 from src.utils.logger import get_logger
 
@@ -24,6 +25,8 @@ async def get_system_status():
     logger.info("시스템 상태 요청 받음")
     try:
         status = SystemInfoCollector.get_simple_status()
+        # 쿼리 임베딩 캐시 적중률 (OpenAI 호출 절감 모니터링용)
+        status["embedding_cache"] = get_embedding_cache_stats()
         return status
     except Exception as e:
         logger.error(f"시스템 상태 수집 중 오류: {e}")
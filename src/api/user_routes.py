@@ -4,12 +4,13 @@
 - 사용자 메모리 관리 (삭제 등)
 - 사용자 프로필 관련 기능
 """
+import re
 from fastapi import APIRouter, Depends, Query, HTTPException
 from typing import Optional
 
 from src.config.settings import MemoryType
 from src.models.memory_models import UserMemoryStats
-from src.service.memory_facade import MemoryFacadeService
+from src.service.memory_facade import MemoryFacadeService, get_memory_facade
 
 router = APIRouter(
     prefix="/api/users", 
@@ -21,15 +22,19 @@ router = APIRouter(
     }
 )
 
-# 의존성 주입 - 싱글톤 패턴
-_memory_facade = None
+# 프로필 항목별 키워드 (앞선 항목이 우선)
+PROFILE_KEYWORDS = {
+    "birthday": ["생일", "태어났", "출생"],
+    "occupation": ["직업", "일하", "근무"],
+    "interests": ["취미", "좋아하", "관심"],
+    "name": ["이름", "불러", "부르"]
+}
 
-def get_memory_facade() -> MemoryFacadeService:
-    """메모리 Facade 의존성 (싱글톤)"""
-    global _memory_facade
-    if _memory_facade is None:
-        _memory_facade = MemoryFacadeService()
-    return _memory_facade
+# 전체 키워드를 항목별 named group으로 묶어 텍스트를 한 번만 스캔
+PROFILE_KEYWORD_RE = re.compile("|".join(
+    f"(?P<{field}>{'|'.join(map(re.escape, keywords))})"
+    for field, keywords in PROFILE_KEYWORDS.items()
+))
 
 
 @router.get("/{user_id}/stats", response_model=UserMemoryStats)
@@ -118,14 +123,11 @@ async def get_user_profile(
             if hasattr(result, 'metadata'):
                 text = result.metadata.get("text", "")
                 # 간단한 키워드 매칭으로 프로필 정보 추출
-                if any(keyword in text for keyword in ["생일", "태어났", "출생"]):
-                    profile_data["birthday"] = text
-                elif any(keyword in text for keyword in ["직업", "일하", "근무"]):
-                    profile_data["occupation"] = text
-                elif any(keyword in text for keyword in ["취미", "좋아하", "관심"]):
-                    profile_data["interests"] = text
-                elif any(keyword in text for keyword in ["이름", "불러", "부르"]):
-                    profile_data["name"] = text
+                matched_fields = {match.lastgroup for match in PROFILE_KEYWORD_RE.finditer(text)}
+                for field in PROFILE_KEYWORDS:
+                    if field in matched_fields:
+                        profile_data[field] = text
+                        break
         
         return {
             "user_id": user_id,
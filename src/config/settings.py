@@ -22,6 +22,10 @@ embedding_config = EmbeddingConfig()
 class DBConfig(BaseSettings):
     qdrant_host: str = os.getenv("QDRANT_HOST", "localhost")
     qdrant_port: int = int(os.getenv("QDRANT_PORT", "6333"))
+    # gRPC 연결 설정 (HTTP/2 단일 연결 다중화로 요청별 연결 비용 제거)
+    qdrant_grpc_port: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    qdrant_prefer_grpc: bool = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+    qdrant_timeout: int = int(os.getenv("QDRANT_TIMEOUT", "30"))
     collection_name: str = os.getenv("QDRANT_COLLECTION", "my_vectors")
     # 벡터 차원 자동 결정 (OpenAI만 지원)
     vector_dim: int = 1536
@@ -30,11 +34,16 @@ class DBConfig(BaseSettings):
 class ServerConfig(BaseSettings):
     server_port: int = int(os.getenv("SERVER_PORT", "8080"))
     server_host: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    # 시스템 정보/상태 수집 결과 캐시 유지 시간 (초)
+    system_info_cache_ttl: float = float(os.getenv("SYSTEM_INFO_CACHE_TTL", "2"))
 
 # 로깅 설정
 class LogConfig(BaseSettings):
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     log_file: str = os.getenv("LOG_FILE", "")
+    # 로그 파일 회전 기준 크기 (바이트) 및 보관할 이전 파일 수
+    log_file_max_bytes: int = int(os.getenv("LOG_FILE_MAX_BYTES", str(100 * 1024 * 1024)))
+    log_file_backup_count: int = int(os.getenv("LOG_FILE_BACKUP_COUNT", "5"))
 
 
 # OpenAI 임베딩 설정
@@ -45,6 +54,14 @@ class OpenAIEmbeddingConfig(BaseSettings):
     vector_dimension: int = int(os.getenv("OPENAI_VECTOR_DIMENSION", "1536"))
     # 임베딩 사용자 식별자 (OpenAI 모니터링용)
     user_identifier: str = os.getenv("OPENAI_USER_IDENTIFIER", "")
+    # OpenAI API 요청 타임아웃 (초) 및 실패 시 재시도 횟수
+    openai_timeout: float = float(os.getenv("OPENAI_TIMEOUT", "30"))
+    openai_max_retries: int = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+    # 임베딩 LRU 캐시 최대 항목 수
+    embedding_cache_size: int = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))
+    # 동시 단건 임베딩 요청을 모으는 시간 창 (밀리초, 0이면 배치 비활성화) 및 최대 배치 크기
+    embedding_batch_window_ms: float = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
 
 # 컬렉션 설정
 class CollectionConfig(BaseSettings):
@@ -57,7 +74,8 @@ class CollectionConfig(BaseSettings):
         return {
             "episodic": {
                 "vector_dim": self.episodic_vector_dim,
-                "distance": "COSINE",
+                # 임베딩 서비스가 단위 벡터를 반환하므로 DOT = 코사인 유사도
+                "distance": "DOT",
                 "metadata_schema": [
                     "user_id", "timestamp", "speaker", "emotion", 
                     "context", "importance_score", "source", "links"
@@ -77,6 +95,18 @@ class CollectionConfig(BaseSettings):
     
     default_collection: str = "semantic"
     auto_create_collections: bool = True
+    
+    # 벡터 양자화 설정 (none | int8 | binary)
+    quantization_type: str = os.getenv("QUANTIZATION_TYPE", "int8")
+    quantization_quantile: float = float(os.getenv("QUANTIZATION_QUANTILE", "0.99"))
+    # 양자화 검색 시 후보를 oversampling 배수만큼 더 가져와 원본 벡터로 재채점
+    quantization_oversampling: float = float(os.getenv("QUANTIZATION_OVERSAMPLING", "2.0"))
+    
+    # HNSW 검색 시 탐색 후보 수 (ef). 0이면 Qdrant 기본값(ef_construct) 사용
+    hnsw_ef: int = int(os.getenv("HNSW_EF_SEARCH", "128"))
+    
+    # 저장 벡터 자료형 (float32 | float16) - float16은 Qdrant 1.10 이상 필요
+    vector_datatype: str = os.getenv("VECTOR_DATATYPE", "float32")
 
 # 인스턴스 생성 (통합 진입점)
 server_config = ServerConfig()
@@ -1,7 +1,13 @@
 from .base import EmbeddingService
 from .openai_embedder import OpenAIEmbeddingService
+from .batching_embedder import BatchingEmbeddingService
+from .cached_embedder import CachedEmbeddingService, get_embedding_service, get_embedding_cache_stats
 
 __all__ = [
     "EmbeddingService",
-    "OpenAIEmbeddingService"
+    "OpenAIEmbeddingService",
+    "BatchingEmbeddingService",
+    "CachedEmbeddingService",
+    "get_embedding_service",
+    "get_embedding_cache_stats"
 ] 
\ No newline at end of file
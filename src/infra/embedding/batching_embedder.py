@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
+from .base import EmbeddingService
+from src.config.settings import openai_embedding_config
+from src.utils import ModelEncodeError
+
+
+class BatchingEmbeddingService(EmbeddingService):
+    """동시에 들어온 단건 임베딩 요청을 짧은 시간 창 동안 모아 한 번의 배치 호출로 처리하는 래퍼."""
+
+    def __init__(self, embedding_service: EmbeddingService, max_batch_size: Optional[int] = None,
+                 window_ms: Optional[float] = None, timeout: Optional[float] = None):
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size or openai_embedding_config.embedding_batch_size
+        window_ms = openai_embedding_config.embedding_batch_window_ms if window_ms is None else window_ms
+        self.window = window_ms / 1000.0
+        # 결과 대기 한도: OpenAI 요청 타임아웃 x (재시도 포함 시도 횟수) + 배치 시간 창
+        if timeout is None:
+            timeout = openai_embedding_config.openai_timeout * (openai_embedding_config.openai_max_retries + 1)
+        self.timeout = timeout + self.window
+        # 캐시 키 구성에 쓰이는 모델 정보는 원본 서비스 값을 그대로 노출
+        self.model_name = getattr(embedding_service, "model_name", type(embedding_service).__name__)
+        self.dimensions = getattr(embedding_service, "dimensions", None)
+        self._pending: List[Tuple[str, Future]] = []
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def encode(self, text: str) -> List[float]:
+        if self.window <= 0:
+            return self.embedding_service.encode(text)
+
+        future: Future = Future()
+        with self._cond:
+            self._pending.append((text, future))
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._worker.start()
+            self._cond.notify()
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 늦게 도착한 결과는 버리도록 취소 (이미 처리된 경우 무시됨)
+            future.cancel()
+            raise ModelEncodeError(f"임베딩 요청 대기 시간 초과 ({self.timeout:.1f}초)")
+
+    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        # 이미 배치인 요청은 모으지 않고 바로 전달
+        return self.embedding_service.encode_batch(texts)
+
+    def _run(self):
+        try:
+            while True:
+                with self._cond:
+                    while not self._pending:
+                        self._cond.wait()
+                    # 첫 요청 이후 시간 창이 끝나거나 배치가 가득 찰 때까지 추가 요청 대기
+                    deadline = time.monotonic() + self.window
+                    while len(self._pending) < self.max_batch_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    batch = self._pending[:self.max_batch_size]
+                    del self._pending[:self.max_batch_size]
+                self._dispatch(batch)
+        finally:
+            # 워커가 예기치 않게 종료되면 다음 요청에서 새 워커를 시작하도록 초기화
+            with self._cond:
+                self._worker = None
+                if self._pending:
+                    self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                    self._worker.start()
+
+    def _dispatch(self, batch: List[Tuple[str, Future]]):
+        # 대기 시간 초과로 취소된 요청은 제외
+        batch = [(text, future) for text, future in batch if not future.cancelled()]
+        if not batch:
+            return
+        try:
+            # 같은 텍스트는 한 번만 임베딩
+            unique_texts = list(dict.fromkeys(text for text, _ in batch))
+            embeddings = self.embedding_service.encode_batch(unique_texts)
+            if len(embeddings) != len(unique_texts):
+                raise ModelEncodeError(
+                    f"임베딩 결과 수가 입력 수와 다릅니다 (입력 {len(unique_texts)}개, 결과 {len(embeddings)}개)"
+                )
+            vectors = dict(zip(unique_texts, embeddings))
+            for text, future in batch:
+                self._resolve(future, result=vectors[text])
+        except Exception as e:
+            # 배치의 모든 요청이 결과 또는 예외를 받도록 보장
+            for _, future in batch:
+                self._resolve(future, exception=e)
+
+    @staticmethod
+    def _resolve(future: Future, result=None, exception: Optional[BaseException] = None):
+        """대기 중인 요청에 결과/예외 설정 (이미 완료되었거나 취소된 요청은 무시)"""
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
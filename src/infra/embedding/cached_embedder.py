@@ -0,0 +1,117 @@
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+import numpy as np
+from .base import EmbeddingService
+from .openai_embedder import OpenAIEmbeddingService
+from .batching_embedder import BatchingEmbeddingService
+from src.config.settings import openai_embedding_config, collection_config
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """임베딩 결과를 단위 벡터로 정규화하고 LRU 캐시로 재사용하는 임베딩 서비스 래퍼."""
+
+    def __init__(self, embedding_service: EmbeddingService, max_size: Optional[int] = None):
+        self.embedding_service = embedding_service
+        self.max_size = max_size or openai_embedding_config.embedding_cache_size
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        # 캐시 벡터는 저장 자료형(float32/float16)의 numpy 배열로 보관해 메모리 절감
+        self._dtype = np.float16 if collection_config.vector_datatype == "float16" else np.float32
+
+    def _cache_key(self, text: str) -> bytes:
+        """(모델, 차원, 정규화된 텍스트) 기반 캐시 키 생성"""
+        model_name = getattr(self.embedding_service, "model_name", type(self.embedding_service).__name__)
+        dimensions = getattr(self.embedding_service, "dimensions", None)
+        # 유니코드 정규화 후 공백 연속/앞뒤 공백 차이는 같은 텍스트로 취급
+        normalized = " ".join(unicodedata.normalize("NFKC", text).split())
+        raw_key = f"{model_name}\x00{dimensions}\x00{normalized}".encode("utf-8")
+        return hashlib.blake2b(raw_key, digest_size=16).digest()
+
+    def _get(self, key: bytes) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._cache.get(key)
+            if vector is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._cache.move_to_end(key)
+            return vector
+
+    def _put(self, key: bytes, vector: List[float]) -> np.ndarray:
+        # 단위 벡터로 정규화해 저장 (DOT 거리 컬렉션에서 코사인 유사도와 동일한 점수)
+        normalized = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(normalized)
+        if norm > 0:
+            normalized = normalized / norm
+        stored = normalized.astype(self._dtype)
+        with self._lock:
+            self._cache[key] = stored
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return stored
+
+    def encode(self, text: str) -> List[float]:
+        key = self._cache_key(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self._put(key, self.embedding_service.encode(text))
+        return vector.tolist()
+
+    def encode_batch(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._cache_key(text) for text in texts]
+        vectors = {key: self._get(key) for key in keys}
+
+        # 캐시에 없는 텍스트만 (중복 제거 후) 한 번의 배치 호출로 임베딩
+        missing = {}
+        for key, text in zip(keys, texts):
+            if vectors[key] is None and key not in missing:
+                missing[key] = text
+
+        if missing:
+            encoded = self.embedding_service.encode_batch(list(missing.values()))
+            for key, vector in zip(missing.keys(), encoded):
+                vectors[key] = self._put(key, vector)
+
+        return [vectors[key].tolist() for key in keys]
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """캐시 크기 및 적중률 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
+
+    def get_embedding(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩 생성 (호환성 메서드)"""
+        return self.encode(text)
+
+
+_embedding_service = None
+_embedding_service_lock = threading.Lock()
+
+def get_embedding_service() -> CachedEmbeddingService:
+    """캐시가 적용된 공유 임베딩 서비스 (싱글톤)"""
+    global _embedding_service
+    if _embedding_service is None:
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                # 캐시 미스인 단건 요청만 배치 래퍼로 모아 OpenAI API 호출 수 절감
+                _embedding_service = CachedEmbeddingService(BatchingEmbeddingService(OpenAIEmbeddingService()))
+    return _embedding_service
+
+
+def get_embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """공유 임베딩 서비스의 캐시 통계 (서비스가 아직 생성되지 않았으면 None)"""
+    service = _embedding_service
+    return service.cache_stats() if service is not None else None
@@ -4,6 +4,9 @@ from .base import EmbeddingService
 from src.utils import ModelEncodeError
 from src.config.settings import openai_embedding_config
 
+# OpenAI 임베딩 API 요청당 최대 입력 개수
+MAX_BATCH_INPUTS = 2048
+
 
 class OpenAIEmbeddingService(EmbeddingService):
 
@@ -19,7 +22,11 @@ class OpenAIEmbeddingService(EmbeddingService):
         if not self.api_key:
             raise ValueError("OpenAI API 키가 설정되지 않았습니다. OPENAI_API_KEY 환경변수를 설정하거나 api_key 매개변수를 제공하세요.")
         
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = openai.OpenAI(
+            api_key=self.api_key,
+            timeout=openai_embedding_config.openai_timeout,
+            max_retries=openai_embedding_config.openai_max_retries
+        )
     
     def encode(self, text: str) -> List[float]:
         try:
@@ -46,7 +53,6 @@ class OpenAIEmbeddingService(EmbeddingService):
         try:
             # OpenAI API 파라미터 구성
             params = {
-                "input": texts,
                 "model": self.model_name
             }
             
@@ -58,8 +64,12 @@ class OpenAIEmbeddingService(EmbeddingService):
             if self.user_identifier:
                 params["user"] = self.user_identifier
             
-            response = self.client.embeddings.create(**params)
-            return [data.embedding for data in response.data]
+            # 요청당 입력 개수 제한에 맞춰 나눠서 호출
+            embeddings = []
+            for start in range(0, len(texts), MAX_BATCH_INPUTS):
+                response = self.client.embeddings.create(input=texts[start:start + MAX_BATCH_INPUTS], **params)
+                embeddings.extend(data.embedding for data in response.data)
+            return embeddings
         except Exception as e:
             raise ModelEncodeError(f"임베딩 모델 인코딩 실패: {e}")
     
@@ -1,11 +1,13 @@
 from .memory_models import (
     MemoryInsertRequest, MemoryInsertResponse, MemorySearchResult,
+    MemoryContent, MemoryBatchInsertRequest, MemoryBatchInsertResponse,
     MultiCollectionSearchResponse, ClassificationResult, 
     UserMemoryStats, SystemStats
 )
 
 __all__ = [
     "MemoryInsertRequest", "MemoryInsertResponse", "MemorySearchResult",
+    "MemoryContent", "MemoryBatchInsertRequest", "MemoryBatchInsertResponse",
     "MultiCollectionSearchResponse", "ClassificationResult", 
     "UserMemoryStats", "SystemStats"
 ]
\ No newline at end of file
@@ -4,11 +4,9 @@ from typing import List, Dict, Optional, Any
 from datetime import datetime
 from src.config.settings import MemoryType
 
-class MemoryInsertRequest(BaseModel):
-    """메모리 삽입 요청 모델 (다중 컬렉션 지원)"""
+class MemoryContent(BaseModel):
+    """메모리 텍스트 및 메타데이터 모델"""
     text: str = Field(description="저장할 텍스트 내용")
-    user_id: str = Field(min_length=1, max_length=50, description="사용자 ID")
-    memory_type: Optional[MemoryType] = Field(default=None, description="메모리 타입 (자동 분류시 None)")
     
     # 공통 메타데이터
     timestamp: Optional[str] = Field(default=None, description="타임스탬프 (ISO 형식)")
@@ -24,6 +22,24 @@ class MemoryInsertRequest(BaseModel):
     # Semantic Memory 전용 필드  
     fact_type: Optional[str] = Field(default=None, description="사실 유형 (personal_fact | world_fact | ai_persona)")
     confidence_score: float = Field(default=1.0, ge=0.0, le=1.0, description="신뢰도 점수")
+
+class MemoryInsertRequest(MemoryContent):
+    """메모리 삽입 요청 모델 (다중 컬렉션 지원)"""
+    user_id: str = Field(min_length=1, max_length=50, description="사용자 ID")
+    memory_type: Optional[MemoryType] = Field(default=None, description="메모리 타입 (자동 분류시 None)")
+    
+    @field_validator('user_id')
+    @classmethod
+    def validate_user_id(cls, v):
+        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+            raise ValueError('사용자 ID는 영문자, 숫자, 언더스코어(_), 하이픈(-)만 사용 가능합니다.')
+        return v
+
+class MemoryBatchInsertRequest(BaseModel):
+    """메모리 배치 삽입 요청 모델"""
+    user_id: str = Field(min_length=1, max_length=50, description="사용자 ID")
+    memory_type: Optional[MemoryType] = Field(default=None, description="메모리 타입 (자동 분류시 None)")
+    memories: List[MemoryContent] = Field(min_length=1, max_length=1000, description="삽입할 메모리 목록")
     
     @field_validator('user_id')
     @classmethod
@@ -87,6 +103,12 @@ class MemoryInsertResponse(BaseModel):
     classification_confidence: Optional[float] = Field(default=None, description="분류 신뢰도")
     classification_explanation: Optional[str] = Field(default=None, description="분류 이유")
 
+class MemoryBatchInsertResponse(BaseModel):
+    """메모리 배치 삽입 응답 모델"""
+    results: List[MemoryInsertResponse] = Field(description="입력 순서대로의 삽입 결과")
+    total_inserted: int = Field(description="삽입된 메모리 수")
+    collection_stats: Dict[str, int] = Field(description="컬렉션별 삽입 수")
+
 class MemorySearchResult(BaseModel):
     """메모리 검색 결과 모델"""
     id: str = Field(description="메모리 ID")
@@ -1,42 +1,202 @@
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    BinaryQuantization, BinaryQuantizationConfig,
+    SearchParams, QuantizationSearchParams, PayloadSchemaType, Datatype,
+    HnswConfigDiff, PayloadSelectorExclude, SearchRequest
+)
+from qdrant_client.http.exceptions import UnexpectedResponse
+import grpc
 from src.config.settings import db_config, collection_config, MemoryType
 from src.repository.base import VectorDBRepository
 from src.models.memory_point import MemoryPoint
+from src.utils.time import parse_epoch
+import os
 import uuid
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timezone
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Union
 import math
+import numpy as np
+
+DISTANCE_MAP = {
+    "COSINE": Distance.COSINE,
+    "DOT": Distance.DOT,
+    "EUCLIDEAN": Distance.EUCLID
+}
+
+# 벡터를 담는 메모리 데이터 키 (벡터는 포인트에 따로 저장되므로 payload에는 넣지 않음)
+_VECTOR_KEYS = ("embedding", "vector")
+
+# 검색 결과 payload에서 제외할 필드 (이전에 payload에 벡터가 함께 저장된 포인트 대응)
+_SEARCH_PAYLOAD = PayloadSelectorExclude(exclude=list(_VECTOR_KEYS))
+
+# 참조 포인트가 없거나 ID 형식이 잘못된 경우의 Qdrant 응답 (REST / gRPC)
+_MISSING_POINT_HTTP_STATUSES = (400, 404)
+_MISSING_POINT_GRPC_CODES = (grpc.StatusCode.NOT_FOUND, grpc.StatusCode.INVALID_ARGUMENT)
+
+# 컬렉션별 검색 RPC를 동시에 실행하기 위한 공유 스레드 풀
+_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="qdrant-search")
+
+# 프로세스 전역 Qdrant 클라이언트 (Repository 인스턴스마다 연결 풀을 새로 만들지 않도록 공유)
+_qdrant_client: Optional[QdrantClient] = None
+_qdrant_client_lock = threading.Lock()
+
+def get_qdrant_client() -> QdrantClient:
+    """공유 Qdrant 클라이언트 반환 (싱글톤)"""
+    global _qdrant_client
+    if _qdrant_client is None:
+        with _qdrant_client_lock:
+            if _qdrant_client is None:
+                _qdrant_client = QdrantClient(
+                    host=db_config.qdrant_host,
+                    port=db_config.qdrant_port,
+                    grpc_port=db_config.qdrant_grpc_port,
+                    prefer_grpc=db_config.qdrant_prefer_grpc,
+                    timeout=db_config.qdrant_timeout
+                )
+    return _qdrant_client
+
+# 존재가 확인된 컬렉션 이름 캐시 (모든 Repository 인스턴스가 같은 Qdrant를 공유)
+_known_collections = set()
+_known_collections_lock = threading.Lock()
+
+def _new_point_ids(count: int) -> List[str]:
+    """시간 순으로 정렬되는 UUIDv7 형식 포인트 ID 생성 (난수는 배치 단위로 한 번에 읽음)"""
+    timestamp_ms = time.time_ns() // 1_000_000 & 0xFFFFFFFFFFFF
+    random_bytes = os.urandom(10 * count)
+    point_ids = []
+    for i in range(count):
+        rand = int.from_bytes(random_bytes[i * 10:(i + 1) * 10], "big")
+        # 48비트 ms 타임스탬프 | 버전 7 | 12비트 난수 | variant 10 | 62비트 난수
+        value = (
+            timestamp_ms << 80 | 0x7 << 76 | (rand >> 68) << 64
+            | 0b10 << 62 | rand & 0x3FFFFFFFFFFFFFFF
+        )
+        point_ids.append(str(uuid.UUID(int=value)))
+    return point_ids
 
 class MemoryQdrantRepository(VectorDBRepository):
     """다중 컬렉션 지원 Qdrant 벡터 데이터베이스 Repository"""
     
     def __init__(self):
-        self.qdrant = QdrantClient(host=db_config.qdrant_host, port=db_config.qdrant_port)
+        self.qdrant = get_qdrant_client()
         self.collection_configs = collection_config.collections
         
     def _ensure_collection(self, collection_name: str):
         """컬렉션이 존재하지 않으면 생성"""
-        collections = [c.name for c in self.qdrant.get_collections().collections]
+        self._ensure_collections([collection_name])
+
+    def _ensure_collections(self, collection_names: List[str]):
+        """여러 컬렉션을 한 번의 목록 조회로 확인하고 없는 컬렉션만 생성 (확인된 컬렉션은 캐시)"""
+        if all(collection_name in _known_collections for collection_name in collection_names):
+            return
         
-        if collection_name not in collections:
-            if collection_name not in self.collection_configs:
-                raise ValueError(f"Unknown collection type: {collection_name}")
-                
-            config = self.collection_configs[collection_name]
-            distance_map = {
-                "COSINE": Distance.COSINE,
-                "DOT": Distance.DOT,
-                "EUCLIDEAN": Distance.EUCLID
-            }
+        with _known_collections_lock:
+            _known_collections.update(c.name for c in self.qdrant.get_collections().collections)
             
-            self.qdrant.recreate_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=config["vector_dim"], 
-                    distance=distance_map.get(config["distance"], Distance.COSINE)
+            for collection_name in collection_names:
+                if collection_name in _known_collections:
+                    continue
+                if collection_name not in self.collection_configs:
+                    raise ValueError(f"Unknown collection type: {collection_name}")
+                self._create_collection(collection_name)
+
+    def _create_collection(self, collection_name: str, vector_dim: Optional[int] = None):
+        """컬렉션 설정에 맞춰 컬렉션 생성 (설정이 없으면 기본값 사용)"""
+        config = self.collection_configs.get(collection_name, {})
+        
+        self.qdrant.recreate_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=config.get("vector_dim") or vector_dim or db_config.vector_dim,
+                distance=DISTANCE_MAP.get(config.get("distance"), Distance.COSINE),
+                datatype=self._build_vector_datatype()
+            ),
+            hnsw_config=self._build_hnsw_config(config),
+            quantization_config=self._build_quantization_config()
+        )
+        
+        # 모든 검색/카운트/삭제가 user_id로 필터링하므로 키워드 인덱스 생성
+        self.qdrant.create_payload_index(
+            collection_name=collection_name,
+            field_name="user_id",
+            field_schema=PayloadSchemaType.KEYWORD
+        )
+        _known_collections.add(collection_name)
+
+    def _build_hnsw_config(self, config: Dict[str, Any]) -> Optional[HnswConfigDiff]:
+        """컬렉션 설정의 index_params로 HNSW 인덱스 구성 (없으면 Qdrant 기본값)"""
+        index_params = config.get("index_params")
+        if not index_params:
+            return None
+        return HnswConfigDiff(
+            m=index_params.get("m"),
+            ef_construct=index_params.get("ef_construct")
+        )
+
+    def _build_vector_datatype(self) -> Optional[Datatype]:
+        """저장 벡터 자료형 (float32는 Qdrant 기본값이므로 지정하지 않음)"""
+        if collection_config.vector_datatype == "float32":
+            return None
+        return Datatype(collection_config.vector_datatype)
+
+    def _build_quantization_config(self) -> Optional[Union[ScalarQuantization, BinaryQuantization]]:
+        """벡터 양자화 설정 구성 (int8 스칼라 양자화 또는 1비트 이진 양자화)"""
+        if collection_config.quantization_type == "int8":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=collection_config.quantization_quantile,
+                    always_ram=True
                 )
             )
+        if collection_config.quantization_type == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    def _build_search_params(self) -> Optional[SearchParams]:
+        """HNSW 탐색 범위와 양자화 재채점(양자화 벡터 검색 후 원본 벡터로 재채점) 검색 파라미터"""
+        hnsw_ef = collection_config.hnsw_ef or None
+        quantization = None
+        if collection_config.quantization_type in ("int8", "binary"):
+            quantization = QuantizationSearchParams(
+                rescore=True,
+                oversampling=collection_config.quantization_oversampling
+            )
+        
+        if hnsw_ef is None and quantization is None:
+            return None
+        return SearchParams(hnsw_ef=hnsw_ef, quantization=quantization)
+
+    def _build_user_filter(self, user_id: str, filters: Optional[Dict] = None) -> Filter:
+        """user_id 및 추가 필터 조건으로 Qdrant 필터 구성"""
+        filter_conditions = [
+            FieldCondition(key="user_id", match=MatchValue(value=user_id))
+        ]
+        
+        # 추가 필터가 있으면 포함
+        if filters:
+            for key, value in filters.items():
+                filter_conditions.append(
+                    FieldCondition(key=key, match=MatchValue(value=value))
+                )
+        
+        return Filter(must=filter_conditions)
+
+    def _to_memory_points(self, results) -> List[MemoryPoint]:
+        """Qdrant 검색 결과를 MemoryPoint 리스트로 변환"""
+        memory_points = []
+        for result in results:
+            memory_point = MemoryPoint(vector=result.vector, metadata=result.payload)
+            memory_point.score = result.score
+            memory_point.id = result.id
+            memory_points.append(memory_point)
+        return memory_points
 
     def get_collection_by_type(self, memory_type: MemoryType) -> str:
         """메모리 타입에 따른 컬렉션 이름 반환"""
@@ -47,76 +207,155 @@ class MemoryQdrantRepository(VectorDBRepository):
         collection_name = self.get_collection_by_type(memory_type)
         self._ensure_collection(collection_name)
         
-        # user_id를 메타데이터에 추가
-        memory_data["user_id"] = user_id
-        
-        point_id = str(uuid.uuid4())
-        qdrant_point = PointStruct(
-            id=point_id,
-            vector=memory_data.get("embedding") or memory_data.get("vector"),
-            payload=memory_data
+        point_id = _new_point_ids(1)[0]
+        self.qdrant.upsert(
+            collection_name=collection_name,
+            points=[self._build_point(point_id, memory_data, user_id)]
         )
-        
-        self.qdrant.upsert(collection_name=collection_name, points=[qdrant_point])
         return point_id
+
+    @staticmethod
+    def _build_point(point_id: str, memory_data: dict, user_id: str) -> PointStruct:
+        """벡터는 포인트 벡터로만 전송하고 payload에는 user_id를 추가한 나머지 메타데이터만 저장"""
+        vector = memory_data.get("embedding") or memory_data.get("vector")
+        payload = {key: value for key, value in memory_data.items() if key not in _VECTOR_KEYS}
+        payload["user_id"] = user_id
+        return PointStruct(id=point_id, vector=vector, payload=payload)
         
-    def search_memory(self, query_vector: List[float], user_id: str, memory_type: MemoryType, limit: int = 10, filters: Optional[Dict] = None) -> List[MemoryPoint]:
-        """user_id 필터링으로 사용자별 검색"""
+    def search_memory(self, query_vector: List[float], user_id: str, memory_type: MemoryType, limit: int = 10, filters: Optional[Dict] = None,
+                      score_threshold: Optional[float] = None) -> List[MemoryPoint]:
+        """user_id 필터링으로 사용자별 검색 (score_threshold 미만 결과는 Qdrant에서 제외)"""
         collection_name = self.get_collection_by_type(memory_type)
         self._ensure_collection(collection_name)
         
-        # user_id 필터 조건
-        filter_conditions = [
-            FieldCondition(key="user_id", match=MatchValue(value=user_id))
-        ]
-        
-        # 추가 필터가 있으면 포함
-        if filters:
-            for key, value in filters.items():
-                filter_conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-        
         results = self.qdrant.search(
             collection_name=collection_name,
             query_vector=query_vector,
-            query_filter=Filter(must=filter_conditions) if filter_conditions else None,
+            query_filter=self._build_user_filter(user_id, filters),
+            search_params=self._build_search_params(),
+            with_payload=_SEARCH_PAYLOAD,
+            score_threshold=score_threshold,
             limit=limit
         )
         
-        memory_points = []
-        for result in results:
-            memory_point = MemoryPoint(vector=result.vector, metadata=result.payload)
-            memory_point.score = result.score
-            memory_point.id = result.id
-            memory_points.append(memory_point)
-            
-        return memory_points
+        return self._to_memory_points(results)
+
+    def search_memory_batch(self, query_vectors: List[List[float]], user_id: str, memory_type: MemoryType, limit: int = 10, filters: Optional[Dict] = None) -> List[List[MemoryPoint]]:
+        """여러 쿼리 벡터를 한 번의 search_batch 요청으로 검색 (쿼리 순서대로 결과 반환)"""
+        if not query_vectors:
+            return []
+        collection_name = self.get_collection_by_type(memory_type)
+        self._ensure_collection(collection_name)
+        
+        # 필터와 검색 파라미터는 모든 쿼리가 공유
+        query_filter = self._build_user_filter(user_id, filters)
+        search_params = self._build_search_params()
+        batch_results = self.qdrant.search_batch(
+            collection_name=collection_name,
+            requests=[
+                SearchRequest(
+                    vector=query_vector,
+                    filter=query_filter,
+                    params=search_params,
+                    limit=limit,
+                    with_payload=_SEARCH_PAYLOAD
+                )
+                for query_vector in query_vectors
+            ]
+        )
+        return [self._to_memory_points(results) for results in batch_results]
 
     def multi_collection_search(self, query_vector: List[float], user_id: str, collections: List[MemoryType], limit: int = 10, weights: Optional[Dict[MemoryType, float]] = None) -> List[MemoryPoint]:
         """다중 컬렉션 검색"""
+        # Qdrant의 search_batch는 단일 컬렉션 대상이므로 컬렉션별 검색은 유지하되,
+        # 컬렉션 확인과 필터 구성은 한 번만 수행
+        collection_names = [self.get_collection_by_type(memory_type) for memory_type in collections]
+        self._ensure_collections(collection_names)
+        query_filter = self._build_user_filter(user_id)
+        search_params = self._build_search_params()
+        
+        def search_collection(collection_name: str):
+            return self.qdrant.search(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                query_filter=query_filter,
+                search_params=search_params,
+                with_payload=_SEARCH_PAYLOAD,
+                limit=limit
+            )
+        
+        # 컬렉션별 검색은 I/O 대기이므로 동시에 실행 (결과 순서는 컬렉션 순서 유지)
+        if len(collection_names) > 1:
+            collection_results = list(_search_executor.map(search_collection, collection_names))
+        else:
+            collection_results = [search_collection(name) for name in collection_names]
+        
         all_results = []
+        all_scores = []
+        collection_types = []
         
-        for memory_type in collections:
-            results = self.search_memory(query_vector, user_id, memory_type, limit)
-            
+        for memory_type, results in zip(collections, collection_results):
             # 가중치 적용
             weight = weights.get(memory_type, 1.0) if weights else 1.0
-            for result in results:
-                result.score = result.score * weight
-                result.collection_type = memory_type.value
-                all_results.append(result)
+            all_results.extend(results)
+            all_scores.extend(result.score * weight for result in results)
+            collection_types.extend([memory_type.value] * len(results))
+        
+        # 점수 배열에서 상위 limit개만 골라 MemoryPoint로 변환
+        scores = np.array(all_scores, dtype=np.float64)
+        memory_points = []
+        for index in self._top_k_indices(scores, limit):
+            result = all_results[index]
+            memory_point = MemoryPoint(vector=result.vector, metadata=result.payload)
+            memory_point.score = float(scores[index])
+            memory_point.id = result.id
+            memory_point.collection_type = collection_types[index]
+            memory_points.append(memory_point)
+        
+        return memory_points
+
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+        """전체 정렬 대신 상위 k개만 선택한 뒤 점수 내림차순으로 정렬한 인덱스"""
+        top_indices = np.arange(len(scores))
+        if len(scores) > k:
+            top_indices = np.argpartition(-scores, k)[:k]
+        return top_indices[np.argsort(-scores[top_indices], kind="stable")]
+
+    def recommend_similar_memories(self, reference_memory_id: str, user_id: str, memory_type: MemoryType, limit: int = 10) -> List[MemoryPoint]:
+        """저장된 메모리의 벡터로 유사 메모리 검색 (재임베딩 없이 포인트 ID 기반, 참조 메모리 자신은 제외)
+        
+        참조 메모리가 없거나 ID 형식이 잘못된 경우 빈 목록 반환
+        """
+        collection_name = self.get_collection_by_type(memory_type)
+        self._ensure_collection(collection_name)
         
-        # 점수순으로 정렬하고 limit 적용
-        all_results.sort(key=lambda x: x.score, reverse=True)
-        return all_results[:limit]
+        try:
+            results = self.qdrant.recommend(
+                collection_name=collection_name,
+                positive=[reference_memory_id],
+                query_filter=self._build_user_filter(user_id),
+                search_params=self._build_search_params(),
+                with_payload=_SEARCH_PAYLOAD,
+                limit=limit
+            )
+        except UnexpectedResponse as e:
+            if e.status_code in _MISSING_POINT_HTTP_STATUSES:
+                return []
+            raise
+        except grpc.RpcError as e:
+            if e.code() in _MISSING_POINT_GRPC_CODES:
+                return []
+            raise
+        
+        return self._to_memory_points(results)
 
     def upsert(self, point: MemoryPoint, collection_name=None):
         """기존 인터페이스 호환성을 위한 메서드"""
         collection_name = collection_name or db_config.collection_name
         self._ensure_collection(collection_name)
         qdrant_point = PointStruct(
-            id=str(uuid.uuid4()),
+            id=_new_point_ids(1)[0],
             vector=point.vector,
             payload=point.metadata
         )
@@ -129,6 +368,8 @@ class MemoryQdrantRepository(VectorDBRepository):
         results = self.qdrant.search(
             collection_name=collection_name,
             query_vector=query_vector,
+            search_params=self._build_search_params(),
+            with_payload=_SEARCH_PAYLOAD,
             limit=limit
         )
         memory_points = [MemoryPoint(vector=result.vector, metadata=result.payload) for result in results]
@@ -145,58 +386,43 @@ class MemoryQdrantRepository(VectorDBRepository):
         collection_name = collection_name or db_config.collection_name
         collections = [c.name for c in self.qdrant.get_collections().collections]
         
+        _known_collections.discard(collection_name)
         if collection_name in collections:
             self.qdrant.delete_collection(collection_name=collection_name)
             
         # 컬렉션 재생성
-        if collection_name in self.collection_configs:
-            config = self.collection_configs[collection_name]
-            distance_map = {
-                "COSINE": Distance.COSINE,
-                "DOT": Distance.DOT,
-                "EUCLIDEAN": Distance.EUCLID
-            }
-            
-            self.qdrant.recreate_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(
-                    size=config["vector_dim"],
-                    distance=distance_map.get(config["distance"], Distance.COSINE)
-                )
-            )
-        else:
-            # 기본 설정으로 생성
-            self.qdrant.recreate_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(size=vector_dim or db_config.vector_dim, distance=Distance.COSINE)
-            )
+        self._create_collection(collection_name, vector_dim)
 
     def get_user_memory_count(self, user_id: str, memory_type: MemoryType) -> int:
         """사용자별 메모리 개수 조회"""
-        collection_name = self.get_collection_by_type(memory_type)
-        self._ensure_collection(collection_name)
+        return self.get_user_memory_counts(user_id, [memory_type])[memory_type]
+
+    def get_user_memory_counts(self, user_id: str, memory_types: List[MemoryType]) -> Dict[MemoryType, int]:
+        """여러 메모리 타입의 사용자별 메모리 개수를 동시에 조회"""
+        collection_names = [self.get_collection_by_type(memory_type) for memory_type in memory_types]
+        self._ensure_collections(collection_names)
+        count_filter = self._build_user_filter(user_id)
         
-        result = self.qdrant.count(
-            collection_name=collection_name,
-            count_filter=Filter(
-                must=[FieldCondition(key="user_id", match=MatchValue(value=user_id))]
-            )
-        )
-        return result.count
+        def count_collection(collection_name: str) -> int:
+            return self.qdrant.count(collection_name=collection_name, count_filter=count_filter).count
+        
+        if len(collection_names) > 1:
+            counts = list(_search_executor.map(count_collection, collection_names))
+        else:
+            counts = [count_collection(name) for name in collection_names]
+        return dict(zip(memory_types, counts))
 
     def delete_user_memories(self, user_id: str, memory_type: Optional[MemoryType] = None):
         """사용자의 메모리 삭제"""
         collections_to_delete = [memory_type] if memory_type else list(MemoryType)
+        collection_names = [self.get_collection_by_type(mem_type) for mem_type in collections_to_delete]
+        self._ensure_collections(collection_names)
+        points_selector = self._build_user_filter(user_id)
         
-        for mem_type in collections_to_delete:
-            collection_name = self.get_collection_by_type(mem_type)
-            self._ensure_collection(collection_name)
-            
+        for collection_name in collection_names:
             self.qdrant.delete(
                 collection_name=collection_name,
-                points_selector=Filter(
-                    must=[FieldCondition(key="user_id", match=MatchValue(value=user_id))]
-                )
+                points_selector=points_selector
             )
 
     def batch_insert_memories(self, memories: List[Dict], user_id: str, memory_type: MemoryType) -> List[str]:
@@ -204,20 +430,11 @@ class MemoryQdrantRepository(VectorDBRepository):
         collection_name = self.get_collection_by_type(memory_type)
         self._ensure_collection(collection_name)
         
-        points = []
-        memory_ids = []
-        
-        for memory_data in memories:
-            memory_data["user_id"] = user_id
-            memory_id = str(uuid.uuid4())
-            memory_ids.append(memory_id)
-            
-            qdrant_point = PointStruct(
-                id=memory_id,
-                vector=memory_data.get("embedding") or memory_data.get("vector"),
-                payload=memory_data
-            )
-            points.append(qdrant_point)
+        memory_ids = _new_point_ids(len(memories))
+        points = [
+            self._build_point(memory_id, memory_data, user_id)
+            for memory_id, memory_data in zip(memory_ids, memories)
+        ]
         
         # 배치 삽입 실행
         self.qdrant.upsert(collection_name=collection_name, points=points)
@@ -225,62 +442,60 @@ class MemoryQdrantRepository(VectorDBRepository):
 
     def search_memory_with_time_weight(self, query_vector: List[float], user_id: str, memory_type: MemoryType, 
                                       limit: int = 10, filters: Optional[Dict] = None, 
-                                      time_weight: float = 0.3, decay_days: int = 30) -> List[MemoryPoint]:
+                                      time_weight: float = 0.3, decay_days: float = 30) -> List[MemoryPoint]:
         """시간 가중치가 적용된 메모리 검색 (최근 기억일수록 높은 점수)"""
+        # 시간 가중치가 없으면 재채점 결과가 원본 점수와 같으므로 초과 조회 없이 일반 검색
+        if time_weight == 0.0:
+            return self.search_memory(query_vector, user_id, memory_type, limit, filters)
+        
         collection_name = self.get_collection_by_type(memory_type)
         self._ensure_collection(collection_name)
         
-        # user_id 필터 조건
-        filter_conditions = [
-            FieldCondition(key="user_id", match=MatchValue(value=user_id))
-        ]
-        
-        # 추가 필터가 있으면 포함
-        if filters:
-            for key, value in filters.items():
-                filter_conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
-        
         # 더 많은 결과를 가져와서 시간 가중치 적용 후 재정렬
         search_limit = min(limit * 3, 100)  # 3배수만큼 가져와서 시간 가중치 적용
         
         results = self.qdrant.search(
             collection_name=collection_name,
             query_vector=query_vector,
-            query_filter=Filter(must=filter_conditions) if filter_conditions else None,
+            query_filter=self._build_user_filter(user_id, filters),
+            search_params=self._build_search_params(),
+            with_payload=_SEARCH_PAYLOAD,
             limit=search_limit
         )
         
-        # 시간 가중치 적용
-        current_time = datetime.now(timezone.utc)
-        memory_points = []
+        # 시간 가중치 적용 (경과 일수 배열에 대해 한 번에 계산)
+        # 결과마다 반복되는 속성/전역 조회를 피하도록 지역 변수로 바인딩
+        current_epoch = time.time()
+        payload_epoch = self._payload_epoch
+        count = len(results)
+        scores = np.fromiter((result.score for result in results), dtype=np.float64, count=count)
+        ts_epochs = np.fromiter((payload_epoch(result.payload) for result in results), dtype=np.float64, count=count)
+        days_ago = np.floor((current_epoch - ts_epochs) / 86400.0)
         
-        for result in results:
-            timestamp_str = result.payload.get("timestamp")
-            if timestamp_str:
-                try:
-                    memory_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    days_ago = (current_time - memory_time).days
-                    
-                    # 지수 감쇠 함수: exp(-days_ago / decay_days)
-                    time_decay = math.exp(-days_ago / decay_days)
-                    
-                    # 원본 유사도 점수와 시간 가중치 결합
-                    adjusted_score = result.score * (1 - time_weight) + time_decay * time_weight
-                    
-                except (ValueError, TypeError):
-                    # 시간 파싱 실패 시 원본 점수 사용
-                    adjusted_score = result.score
-            else:
-                # 타임스탬프 없으면 원본 점수 사용
-                adjusted_score = result.score
-            
+        # 지수 감쇠 함수: exp(-days_ago / decay_days)
+        time_decay = np.exp(-days_ago / decay_days)
+        
+        # 원본 유사도 점수와 시간 가중치 결합 (타임스탬프 없거나 파싱 실패 시 원본 점수 사용)
+        adjusted_scores = np.where(
+            np.isnan(days_ago),
+            scores,
+            scores * (1 - time_weight) + time_decay * time_weight
+        )
+        
+        memory_points = []
+        for index in self._top_k_indices(adjusted_scores, limit):
+            result = results[index]
             memory_point = MemoryPoint(vector=result.vector, metadata=result.payload)
-            memory_point.score = adjusted_score
+            memory_point.score = float(adjusted_scores[index])
             memory_point.id = result.id
             memory_points.append(memory_point)
         
-        # 조정된 점수로 재정렬하고 limit 적용
-        memory_points.sort(key=lambda x: x.score, reverse=True)
-        return memory_points[:limit]
\ No newline at end of file
+        return memory_points
+
+    @staticmethod
+    def _payload_epoch(payload: Dict[str, Any]) -> float:
+        """저장된 epoch 초 (이전 데이터는 타임스탬프 파싱, 없거나 파싱 실패 시 NaN)"""
+        ts_epoch = payload.get("ts_epoch")
+        if ts_epoch is None:
+            ts_epoch = parse_epoch(payload.get("timestamp"))
+        return math.nan if ts_epoch is None else ts_epoch
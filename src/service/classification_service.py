@@ -3,6 +3,9 @@
 - 단일 책임: 메모리 분류만 담당
 - 비즈니스 로직을 분류기에서 서비스로 이동
 """
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List
 from src.config.settings import MemoryType
 from src.service.memory_classifier import MemoryClassifier
@@ -11,13 +14,40 @@ from src.service.memory_classifier import MemoryClassifier
 class MemoryClassificationService:
     """메모리 분류 비즈니스 로직 서비스"""
     
+    # 메타데이터 없는 분류 결과 LRU 캐시 최대 항목 수 (검색 쿼리 등 같은 텍스트가 반복 분류됨)
+    CACHE_MAX_SIZE = 4096
+    
     def __init__(self):
         self.classifier = MemoryClassifier()
+        self._cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def classify_memory(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """메모리 자동 분류"""
-        metadata = metadata or {}
+        """메모리 자동 분류 (메타데이터가 없으면 텍스트 기준 캐시 사용)"""
+        if metadata:
+            return self._classify(text, metadata)
+        
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is None:
+            cached = self._classify(text, {})
+            with self._cache_lock:
+                self._cache[key] = cached
+                if len(self._cache) > self.CACHE_MAX_SIZE:
+                    self._cache.popitem(last=False)
         
+        # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return {
+            **cached,
+            "features": dict(cached["features"]),
+            "business_rules_applied": list(cached["business_rules_applied"])
+        }
+    
+    def _classify(self, text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """분류기 실행 및 비즈니스 규칙 적용"""
         # 기본 분류 실행
         classification = self.classifier.classify_with_confidence(text, metadata)
         
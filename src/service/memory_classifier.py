@@ -1,7 +1,33 @@
 import re
-from typing import Dict, Any
+import numpy as np
+from typing import Dict, Any, List, Tuple, Pattern
 from src.config.settings import MemoryType
 from src.models.memory_point import MemoryPoint
+from src.utils.logger import get_logger
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = get_logger(__name__)
+
+# 특수 케이스 판단용 정규식
+QUESTION_RE = re.compile(r'\?|뭐|어떻|언제|어디|왜|누구|어느')
+ASSERTION_RE = re.compile(r'이다$|다$|입니다$|됩니다$')
+
+# 분류 특징 (앞의 5개는 패턴 카테고리별 일치 수, 나머지는 컨텍스트/특수 케이스 플래그)
+MATCH_FEATURES = ("temporal", "emotional", "conversation", "factual", "profile")
+FEATURES = MATCH_FEATURES + (
+    "conversation_context", "emotion_context", "fact_type", "question", "assertion", "short_text"
+)
+
+# 특징별 점수 가중치 (행: episodic, semantic)
+SCORE_WEIGHTS = np.array([
+    [2, 3, 2, 0, 0, 2, 3, 0, 2, 0, 1],
+    [0, 0, 0, 2, 3, 0, 0, 5, 0, 1, 0]
+], dtype=np.int32)
+MATCH_SCORE_WEIGHTS = SCORE_WEIGHTS[:, :len(MATCH_FEATURES)]
 
 class MemoryClassifier:
     """메모리 타입 자동 분류 및 라우팅 시스템"""
@@ -49,76 +75,120 @@ class MemoryClassifier:
             r'\b(이름|성격|특징|습관|버릇|취향)\w*\b',
             r'\b(전화|연락|메일|SNS|계정)\w*\b'
         ]
+        
+        category_patterns = {
+            "temporal": self.temporal_patterns,
+            "emotional": self.emotional_patterns,
+            "conversation": self.conversation_patterns,
+            "factual": self.factual_patterns,
+            "profile": self.profile_patterns
+        }
+        
+        # 카테고리별 (통합 정규식, 개별 정규식 목록) 사전 컴파일
+        self._compiled_patterns = {
+            category: self._compile_category(patterns)
+            for category, patterns in category_patterns.items()
+        }
+        
+        # hyperscan이 설치되어 있으면 전체 패턴을 단일 스캔 DB로 컴파일
+        self._hs_database, self._hs_candidates = self._compile_hyperscan(category_patterns)
+        
+        # 패턴 ID를 비트 위치로 하는 카테고리별 비트마스크 (일치 수 = popcount)
+        self._hs_category_masks = dict.fromkeys(category_patterns, 0)
+        for pattern_id, (category, _) in enumerate(self._hs_candidates):
+            self._hs_category_masks[category] |= 1 << pattern_id
+
+    @staticmethod
+    def _compile_hyperscan(category_patterns: Dict[str, List[str]]):
+        """전체 패턴을 hyperscan DB로 컴파일 (패턴 ID → (카테고리, 확인용 정규식) 매핑 포함)"""
+        if hyperscan is None:
+            return None, []
+        
+        candidates = []
+        expressions = []
+        for category, patterns in category_patterns.items():
+            for pattern in patterns:
+                candidates.append((category, re.compile(pattern)))
+                expressions.append(pattern.encode("utf-8"))
+        
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                # UCP 모드의 \b는 지원되지 않으므로 prefilter(상위 집합) 모드로 컴파일하고
+                # 후보 패턴만 정규식으로 확인, 패턴별로 최초 일치만 보고받음
+                flags=[
+                    hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                    | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH
+                ] * len(expressions)
+            )
+        except Exception as e:
+            logger.warning(f"hyperscan 패턴 컴파일 실패, 정규식 분류로 대체: {e}")
+            return None, []
+        
+        return database, candidates
+
+    @staticmethod
+    def _compile_category(patterns: List[str]) -> Tuple[Pattern, List[Pattern]]:
+        """카테고리 패턴을 하나의 통합 정규식과 개별 정규식 목록으로 컴파일"""
+        union_re = re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+        return union_re, [re.compile(pattern) for pattern in patterns]
+
+    def _count_matches(self, content: str) -> Dict[str, int]:
+        """카테고리별로 일치하는 패턴 수 계산"""
+        if self._hs_database is not None:
+            matched_ids = set()
+            self._hs_database.scan(
+                content.encode("utf-8"),
+                match_event_handler=lambda pattern_id, start, end, flags, context: matched_ids.add(pattern_id)
+            )
+            matched_mask = 0
+            for pattern_id in matched_ids:
+                if self._hs_candidates[pattern_id][1].search(content):
+                    matched_mask |= 1 << pattern_id
+            return {
+                category: bin(matched_mask & category_mask).count("1")
+                for category, category_mask in self._hs_category_masks.items()
+            }
+        
+        return {
+            category: self._count_category_matches(category, content)
+            for category in self._compiled_patterns
+        }
+
+    def _count_category_matches(self, category: str, content: str) -> int:
+        """카테고리에서 일치하는 패턴 수 (일치가 없으면 통합 정규식 한 번으로 종료)"""
+        union_re, pattern_res = self._compiled_patterns[category]
+        if not union_re.search(content):
+            return 0
+        return sum(1 for pattern_re in pattern_res if pattern_re.search(content))
+
+    def _extract_features(self, content: str, context: Dict[str, Any]) -> np.ndarray:
+        """FEATURES 순서의 특징 벡터 생성"""
+        match_counts = self._count_matches(content)
+        return np.array([
+            *(match_counts[category] for category in MATCH_FEATURES),
+            # 대화 맥락 / 감정 정보 / 명시적 사실 타입
+            bool(context.get("conversation_id") or context.get("speaker")),
+            bool(context.get("emotion")),
+            bool(context.get("fact_type")),
+            # 질문 형태는 episodic, 단정적 서술은 semantic 경향
+            bool(QUESTION_RE.search(content)),
+            bool(ASSERTION_RE.search(content)),
+            # 매우 짧은 텍스트는 episodic 경향
+            len(content) < 10
+        ], dtype=np.int32)
 
     def determine_memory_type(self, content: str, context: Dict[str, Any] = None) -> MemoryType:
         """AI 기반 메모리 타입 자동 분류"""
-        content_lower = content.lower()
-        context = context or {}
+        features = self._extract_features(content, context or {})
+        episodic_score, semantic_score = SCORE_WEIGHTS @ features
         
-        # 점수 계산
-        episodic_score = 0
-        semantic_score = 0
-        
-        # 1. 시간 표현 검사
-        temporal_matches = sum(1 for pattern in self.temporal_patterns if re.search(pattern, content))
-        if temporal_matches > 0:
-            episodic_score += temporal_matches * 2
-            
-        # 2. 감정 표현 검사
-        emotional_matches = sum(1 for pattern in self.emotional_patterns if re.search(pattern, content))
-        if emotional_matches > 0:
-            episodic_score += emotional_matches * 3
-            
-        # 3. 대화 표현 검사
-        conversation_matches = sum(1 for pattern in self.conversation_patterns if re.search(pattern, content))
-        if conversation_matches > 0:
-            episodic_score += conversation_matches * 2
-            
-        # 4. 사실/지식 표현 검사
-        factual_matches = sum(1 for pattern in self.factual_patterns if re.search(pattern, content))
-        if factual_matches > 0:
-            semantic_score += factual_matches * 2
-            
-        # 5. 개인 프로필 검사
-        profile_matches = sum(1 for pattern in self.profile_patterns if re.search(pattern, content))
-        if profile_matches > 0:
-            semantic_score += profile_matches * 3
-            
-        # 6. 컨텍스트 정보 활용
-        if context:
-            # 대화 맥락이 있으면 episodic 가중치 증가
-            if context.get("conversation_id") or context.get("speaker"):
-                episodic_score += 2
-                
-            # 감정 정보가 있으면 episodic 가중치 증가
-            if context.get("emotion"):
-                episodic_score += 3
-                
-            # 명시적으로 사실 타입이 지정되면 semantic
-            if context.get("fact_type"):
-                semantic_score += 5
-        
-        # 7. 특수 케이스 처리
-        # 질문 형태는 대부분 episodic (대화 맥락)
-        if re.search(r'\?|뭐|어떻|언제|어디|왜|누구|어느', content):
-            episodic_score += 2
-            
-        # 단정적 서술은 semantic 경향
-        if re.search(r'이다$|다$|입니다$|됩니다$', content):
-            semantic_score += 1
-            
-        # 8. 길이 기반 판단 (매우 짧은 텍스트는 episodic 경향)
-        if len(content) < 10:
-            episodic_score += 1
-            
-        # 9. 최종 분류
+        # 동점인 경우 기본값은 semantic (더 일반적)
         if episodic_score > semantic_score:
             return MemoryType.EPISODIC
-        elif semantic_score > episodic_score:
-            return MemoryType.SEMANTIC
-        else:
-            # 동점인 경우 기본값은 semantic (더 일반적)
-            return MemoryType.SEMANTIC
+        return MemoryType.SEMANTIC
     
     def route_to_collection(self, memory_point: MemoryPoint, user_id: str) -> str:
         """메모리를 적절한 컬렉션으로 라우팅"""
@@ -132,35 +202,15 @@ class MemoryClassifier:
         """분류 결과와 신뢰도를 함께 반환"""
         context = context or {}
         
-        # 각 타입별 점수 계산
+        # 패턴 일치 수만으로 타입별 점수 계산
+        match_counts = self._count_matches(content)
+        features = np.array([match_counts[category] for category in MATCH_FEATURES], dtype=np.int32)
+        episodic_score, semantic_score = MATCH_SCORE_WEIGHTS @ features
         scores = {
-            MemoryType.EPISODIC: 0,
-            MemoryType.SEMANTIC: 0
+            MemoryType.EPISODIC: int(episodic_score),
+            MemoryType.SEMANTIC: int(semantic_score)
         }
         
-        # 점수 계산 로직 (위와 동일)
-        content_lower = content.lower()
-        
-        # 시간 표현
-        temporal_matches = sum(1 for pattern in self.temporal_patterns if re.search(pattern, content))
-        scores[MemoryType.EPISODIC] += temporal_matches * 2
-        
-        # 감정 표현
-        emotional_matches = sum(1 for pattern in self.emotional_patterns if re.search(pattern, content))
-        scores[MemoryType.EPISODIC] += emotional_matches * 3
-        
-        # 대화 표현
-        conversation_matches = sum(1 for pattern in self.conversation_patterns if re.search(pattern, content))
-        scores[MemoryType.EPISODIC] += conversation_matches * 2
-        
-        # 사실/지식 표현
-        factual_matches = sum(1 for pattern in self.factual_patterns if re.search(pattern, content))
-        scores[MemoryType.SEMANTIC] += factual_matches * 2
-        
-        # 개인 프로필
-        profile_matches = sum(1 for pattern in self.profile_patterns if re.search(pattern, content))
-        scores[MemoryType.SEMANTIC] += profile_matches * 3
-        
         # 최종 분류
         predicted_type = max(scores, key=scores.get)
         total_score = sum(scores.values())
@@ -171,11 +221,8 @@ class MemoryClassifier:
             "confidence": confidence,
             "scores": scores,
             "features": {
-                "temporal_matches": temporal_matches,
-                "emotional_matches": emotional_matches,
-                "conversation_matches": conversation_matches,
-                "factual_matches": factual_matches,
-                "profile_matches": profile_matches
+                f"{category}_matches": match_counts[category]
+                for category in MATCH_FEATURES
             }
         }
     
@@ -3,15 +3,34 @@
 - Facade 패턴: 복잡한 서비스들을 단일 인터페이스로 제공
 - 서비스 간 조율 및 통합 로직 담당
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import threading
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from src.config.settings import MemoryType
 from src.models.memory_point import MemoryPoint
 from src.service.classification_service import MemoryClassificationService
 from src.service.search_service import MemorySearchService, IntelligentSearchService
 from src.repository.memory_repository import MemoryQdrantRepository
-from src.infra.embedding import OpenAIEmbeddingService
+from src.infra.embedding import get_embedding_service
+from src.utils.time import parse_epoch
 from datetime import datetime, timezone
 
+# 요청마다 반복되는 Enum 속성 조회를 피하기 위한 모듈 수준 바인딩
+EPISODIC = MemoryType.EPISODIC
+SEMANTIC = MemoryType.SEMANTIC
+_MT_VALUE = {mt: mt.value for mt in MemoryType}
+
+
+@lru_cache(maxsize=256)
+def _search_weights_for(predicted_type: MemoryType, confidence: float) -> Tuple[float, float]:
+    """예측 타입과 신뢰도에 따른 (episodic, semantic) 검색 가중치 (신뢰도 값은 몇 가지 비율로 반복되므로 캐시)"""
+    boosted = 1.0 + confidence * 0.5
+    damped = 1.0 - confidence * 0.3
+    if predicted_type == EPISODIC:
+        return boosted, damped
+    return damped, boosted
+
 
 class MemoryFacadeService:
     """메모리 시스템의 통합 파사드"""
@@ -20,9 +39,9 @@ class MemoryFacadeService:
         # 각 서비스 의존성 주입 (DI 패턴)
         self.classification_service = MemoryClassificationService()
         self.search_service = MemorySearchService()
-        self.intelligent_search_service = IntelligentSearchService()
+        self.intelligent_search_service = IntelligentSearchService(self.search_service)
         self.repository = MemoryQdrantRepository()
-        self.embedding_service = OpenAIEmbeddingService()
+        self.embedding_service = get_embedding_service()
     
     # === 메모리 삽입 관련 메서드 ===
     
@@ -51,11 +70,75 @@ class MemoryFacadeService:
         # 5. 결과 반환
         return {
             "id": memory_id,
-            "memory_type": memory_type.value,
+            "memory_type": _MT_VALUE[memory_type],
+            "timestamp": memory_data["timestamp"],
             "classification": classification_result,
             "confidence": classification_result["confidence"],
             "explanation": classification_result["explanation"]
         }
+
+    def insert_memory_batch(
+        self,
+        texts: List[str],
+        user_id: str,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        memory_type: Optional[MemoryType] = None
+    ) -> List[Dict[str, Any]]:
+        """배치 메모리 삽입 (임베딩 1회 배치 호출, 컬렉션별 1회 upsert, memory_type이 없으면 자동 분류)"""
+        if not texts:
+            return []
+        metadatas = [metadata or {} for metadata in (metadatas or [{}] * len(texts))]
+        if len(metadatas) != len(texts):
+            raise ValueError("texts와 metadatas의 길이가 일치하지 않습니다.")
+        
+        # 1. 메모리 분류 (타입이 지정되지 않은 경우)
+        classifications = None
+        if memory_type is None:
+            classifications = self.classification_service.batch_classify(texts, metadatas)
+            memory_types = [classification["predicted_type"] for classification in classifications]
+        else:
+            memory_types = [memory_type] * len(texts)
+        
+        # 2. 임베딩 배치 생성
+        embeddings = self.embedding_service.encode_batch(texts)
+        
+        # 3. 메모리 타입별로 묶어서 삽입
+        grouped: Dict[MemoryType, List[int]] = {}
+        for index, item_type in enumerate(memory_types):
+            grouped.setdefault(item_type, []).append(index)
+        
+        # 배치 전체에 같은 생성 시각 사용
+        now = datetime.now(timezone.utc)
+        memory_data_list = [
+            self._build_memory_data(text, embedding, metadata, now)
+            for text, embedding, metadata in zip(texts, embeddings, metadatas)
+        ]
+        memory_ids: List[Optional[str]] = [None] * len(texts)
+        for item_type, indices in grouped.items():
+            inserted_ids = self.repository.batch_insert_memories(
+                [memory_data_list[i] for i in indices], user_id, item_type
+            )
+            for i, memory_id in zip(indices, inserted_ids):
+                memory_ids[i] = memory_id
+        
+        # 4. 입력 순서대로 결과 반환
+        results = []
+        for i, memory_id in enumerate(memory_ids):
+            result = {
+                "id": memory_id,
+                "memory_type": _MT_VALUE[memory_types[i]],
+                "timestamp": memory_data_list[i]["timestamp"]
+            }
+            if classifications is None:
+                result["classification_method"] = "manual"
+            else:
+                result.update({
+                    "classification": classifications[i],
+                    "confidence": classifications[i]["confidence"],
+                    "explanation": classifications[i]["explanation"]
+                })
+            results.append(result)
+        return results
     
     def insert_memory_with_manual_type(
         self,
@@ -78,11 +161,47 @@ class MemoryFacadeService:
         
         return {
             "id": memory_id,
-            "memory_type": memory_type.value,
+            "memory_type": _MT_VALUE[memory_type],
+            "timestamp": memory_data["timestamp"],
             "classification_method": "manual",
             "text": text
         }
     
+    async def insert_memory_with_auto_classification_async(
+        self,
+        text: str,
+        user_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """자동 분류 메모리 삽입 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(
+            self.insert_memory_with_auto_classification, text, user_id, metadata
+        )
+    
+    async def insert_memory_batch_async(
+        self,
+        texts: List[str],
+        user_id: str,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        memory_type: Optional[MemoryType] = None
+    ) -> List[Dict[str, Any]]:
+        """배치 메모리 삽입 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(
+            self.insert_memory_batch, texts, user_id, metadatas, memory_type
+        )
+    
+    async def insert_memory_with_manual_type_async(
+        self,
+        text: str,
+        user_id: str,
+        memory_type: MemoryType,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """수동 타입 메모리 삽입 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(
+            self.insert_memory_with_manual_type, text, user_id, memory_type, metadata
+        )
+    
     # === 메모리 검색 관련 메서드 ===
     
     def search_memory_intelligent(
@@ -100,11 +219,12 @@ class MemoryFacadeService:
         user_id: str,
         memory_type: MemoryType,
         limit: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
     ) -> List[MemoryPoint]:
         """단일 컬렉션 검색"""
         return self.search_service.search_single_collection(
-            query, user_id, memory_type, limit, filters
+            query, user_id, memory_type, limit, filters, score_threshold
         )
     
     def search_memory_multi_collection(
@@ -120,6 +240,55 @@ class MemoryFacadeService:
             query, user_id, collections, limit, weights
         )
     
+    def search_memory_single_collection_batch(
+        self,
+        queries: List[str],
+        user_id: str,
+        memory_type: MemoryType,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[MemoryPoint]]:
+        """여러 쿼리 단일 컬렉션 검색 (쿼리 순서대로 결과 목록 반환)"""
+        return self.search_service.search_single_collection_batch(
+            queries, user_id, memory_type, limit, filters
+        )
+    
+    async def search_memory_single_collection_async(
+        self,
+        query: str,
+        user_id: str,
+        memory_type: MemoryType,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
+    ) -> List[MemoryPoint]:
+        """단일 컬렉션 검색 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(
+            self.search_memory_single_collection, query, user_id, memory_type, limit, filters, score_threshold
+        )
+    
+    async def search_memory_intelligent_async(
+        self,
+        query: str,
+        user_id: str,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """지능형 검색 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(self.search_memory_intelligent, query, user_id, limit)
+    
+    async def search_memory_multi_collection_async(
+        self,
+        query: str,
+        user_id: str,
+        collections: List[MemoryType] = None,
+        limit: int = 10,
+        weights: Optional[Dict[MemoryType, float]] = None
+    ) -> List[MemoryPoint]:
+        """다중 컬렉션 통합 검색 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(
+            self.search_memory_multi_collection, query, user_id, collections, limit, weights
+        )
+    
     def search_with_intelligent_weights(
         self,
         query: str,
@@ -129,25 +298,33 @@ class MemoryFacadeService:
         """지능형 가중치를 사용한 검색 (하위 호환성)"""
         # 쿼리 분류를 통한 가중치 결정
         classification = self.classification_service.classify_memory(query, {})
-        weights = self._calculate_search_weights(classification)
+        
+        # 분류 신뢰도가 임계값 미만이면 편향된 가중치 없이 동일 가중치로 검색
+        if self.classification_service.should_request_manual_classification(classification):
+            weights = None
+            applied_weights = {EPISODIC: 1.0, SEMANTIC: 1.0}
+            explanation = f"쿼리 '{query}' 분류 신뢰도가 낮아 동일 가중치 적용"
+        else:
+            weights = applied_weights = self._calculate_search_weights(classification)
+            explanation = f"쿼리 '{query}' 분석 결과 적용된 가중치"
         
         # 검색 실행
         results = self.search_service.search_multi_collection(
-            query, user_id, [MemoryType.EPISODIC, MemoryType.SEMANTIC], limit, weights
+            query, user_id, [EPISODIC, SEMANTIC], limit, weights
         )
         
         return {
             "results": results,
-            "applied_weights": weights,
+            "applied_weights": applied_weights,
             "query_classification": classification,
-            "explanation": f"쿼리 '{query}' 분석 결과 적용된 가중치"
+            "explanation": explanation
         }
     
     def search_time_weighted(
         self,
         query: str,
         user_id: str,
-        memory_type: MemoryType = MemoryType.EPISODIC,
+        memory_type: MemoryType = EPISODIC,
         limit: int = 10,
         decay_factor: float = 0.1
     ) -> List[MemoryPoint]:
@@ -156,12 +333,39 @@ class MemoryFacadeService:
             query, user_id, memory_type, limit, decay_factor
         )
     
+    def search_similar_memories(
+        self,
+        reference_memory_id: str,
+        user_id: str,
+        memory_type: MemoryType,
+        limit: int = 10
+    ) -> List[MemoryPoint]:
+        """저장된 메모리와 유사한 메모리 검색"""
+        return self.search_service.semantic_similarity_search(
+            reference_memory_id, user_id, memory_type, limit
+        )
+    
+    async def search_similar_memories_async(
+        self,
+        reference_memory_id: str,
+        user_id: str,
+        memory_type: MemoryType,
+        limit: int = 10
+    ) -> List[MemoryPoint]:
+        """유사 메모리 검색 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        return await asyncio.to_thread(
+            self.search_similar_memories, reference_memory_id, user_id, memory_type, limit
+        )
+    
     # === 메모리 관리 관련 메서드 ===
     
     def get_user_memory_summary(self, user_id: str) -> Dict[str, Any]:
         """사용자 메모리 요약 정보"""
-        episodic_count = self.repository.get_user_memory_count(user_id, MemoryType.EPISODIC)
-        semantic_count = self.repository.get_user_memory_count(user_id, MemoryType.SEMANTIC)
+        counts = self.repository.get_user_memory_counts(
+            user_id, [EPISODIC, SEMANTIC]
+        )
+        episodic_count = counts[EPISODIC]
+        semantic_count = counts[SEMANTIC]
         
         total_memories = episodic_count + semantic_count
         
@@ -174,7 +378,8 @@ class MemoryFacadeService:
                 "episodic_ratio": episodic_count / max(total_memories, 1),
                 "semantic_ratio": semantic_count / max(total_memories, 1)
             },
-            "classification_service_threshold": self.classification_service.get_classification_confidence_threshold()
+            "classification_service_threshold": self.classification_service.get_classification_confidence_threshold(),
+            "embedding_cache": self.embedding_service.cache_stats()
         }
     
     def delete_user_memories(
@@ -184,22 +389,20 @@ class MemoryFacadeService:
     ) -> Dict[str, Any]:
         """사용자 메모리 삭제"""
         try:
-            # 삭제 전 카운트 조회
-            before_summary = self.get_user_memory_summary(user_id)
+            # 삭제 전 카운트 조회 (타입별 동시 조회 1회, 삭제 후 재조회 없이 계산)
+            before_counts = self.repository.get_user_memory_counts(user_id, list(MemoryType))
+            deleted_types = [memory_type] if memory_type else list(MemoryType)
             
             # 삭제 실행
             self.repository.delete_user_memories(user_id, memory_type)
             
-            # 삭제 후 카운트 조회
-            after_summary = self.get_user_memory_summary(user_id)
-            
-            deleted_count = before_summary["total_memories"] - after_summary["total_memories"]
+            deleted_count = sum(before_counts[deleted_type] for deleted_type in deleted_types)
             
             return {
                 "user_id": user_id,
-                "deleted_memory_type": memory_type.value if memory_type else "all",
+                "deleted_memory_type": _MT_VALUE[memory_type] if memory_type else "all",
                 "deleted_count": deleted_count,
-                "remaining_count": after_summary["total_memories"],
+                "remaining_count": sum(before_counts.values()) - deleted_count,
                 "success": True
             }
             
@@ -213,19 +416,19 @@ class MemoryFacadeService:
     def reset_collection(self, memory_type: MemoryType) -> Dict[str, Any]:
         """컬렉션 초기화"""
         try:
-            collection_name = memory_type.value
+            collection_name = _MT_VALUE[memory_type]
             self.repository.reset_collection(collection_name)
             
             return {
                 "collection_name": collection_name,
-                "memory_type": memory_type.value,
+                "memory_type": _MT_VALUE[memory_type],
                 "reset_success": True,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
         except Exception as e:
             return {
-                "collection_name": memory_type.value,
+                "collection_name": _MT_VALUE[memory_type],
                 "error": str(e),
                 "reset_success": False
             }
@@ -233,12 +436,12 @@ class MemoryFacadeService:
     def get_collection_stats(self, memory_type: MemoryType) -> Dict[str, Any]:
         """컬렉션 통계 정보"""
         try:
-            collection_name = memory_type.value
+            collection_name = _MT_VALUE[memory_type]
             stats = self.repository.get_collection_stats(collection_name)
             
             return {
                 "collection_name": collection_name,
-                "memory_type": memory_type.value,
+                "memory_type": _MT_VALUE[memory_type],
                 "total_points": stats.points_count,
                 "vector_size": stats.config.params.vectors.size,
                 "distance_function": stats.config.params.vectors.distance.value
@@ -246,7 +449,7 @@ class MemoryFacadeService:
             
         except Exception as e:
             return {
-                "collection_name": memory_type.value,
+                "collection_name": _MT_VALUE[memory_type],
                 "error": str(e)
             }
     
@@ -267,29 +470,51 @@ class MemoryFacadeService:
     
     # === Private Helper Methods ===
     
-    def _build_memory_data(self, text: str, embedding: List[float], metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """메모리 데이터 구성"""
-        return {
-            "text": text,
-            "embedding": embedding,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "importance_score": metadata.get("importance_score", 0.5),
-            "source": metadata.get("source", "facade_service"),
-            **metadata  # 추가 메타데이터
-        }
+    def _build_memory_data(
+        self,
+        text: str,
+        embedding: List[float],
+        metadata: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """메모리 데이터 구성 (now: 요청 단위로 한 번 구한 생성 시각)"""
+        now = now or datetime.now(timezone.utc)
+        # 메타데이터를 한 번만 복사하고 없는 키만 채움 (호출자가 지정한 값이 우선)
+        memory_data = dict(metadata)
+        memory_data.setdefault("text", text)
+        memory_data.setdefault("embedding", embedding)
+        memory_data.setdefault("importance_score", 0.5)
+        memory_data.setdefault("source", "facade_service")
+        
+        # 검색 시 시간 파싱을 피하기 위해 epoch 초를 함께 저장 (지정된 타임스탬프가 있으면 그 기준)
+        if "timestamp" in memory_data:
+            ts_epoch = parse_epoch(memory_data["timestamp"])
+        else:
+            memory_data["timestamp"] = now.isoformat()
+            ts_epoch = now.timestamp()
+        if ts_epoch is not None:
+            memory_data["ts_epoch"] = ts_epoch
+        return memory_data
     
     def _calculate_search_weights(self, classification: Dict[str, Any]) -> Dict[MemoryType, float]:
         """검색 가중치 계산"""
-        predicted_type = classification["predicted_type"]
-        confidence = classification["confidence"]
-        
-        if predicted_type == MemoryType.EPISODIC:
-            return {
-                MemoryType.EPISODIC: 1.0 + confidence * 0.5,
-                MemoryType.SEMANTIC: 1.0 - confidence * 0.3
-            }
-        else:
-            return {
-                MemoryType.EPISODIC: 1.0 - confidence * 0.3,
-                MemoryType.SEMANTIC: 1.0 + confidence * 0.5
-            }
\ No newline at end of file
+        episodic_weight, semantic_weight = _search_weights_for(
+            classification["predicted_type"], classification["confidence"]
+        )
+        return {
+            EPISODIC: episodic_weight,
+            SEMANTIC: semantic_weight
+        }
+
+
+_memory_facade = None
+_memory_facade_lock = threading.Lock()
+
+def get_memory_facade() -> MemoryFacadeService:
+    """프로세스 전역 메모리 Facade (싱글톤) - 모든 라우터와 레거시 래퍼가 공유"""
+    global _memory_facade
+    if _memory_facade is None:
+        with _memory_facade_lock:
+            if _memory_facade is None:
+                _memory_facade = MemoryFacadeService()
+    return _memory_facade
@@ -4,13 +4,18 @@
 - 다양한 검색 전략을 제공
 """
 import re
+import math
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timezone
-import numpy as np
 from src.models.memory_point import MemoryPoint
 from src.config.settings import MemoryType
 from src.repository.memory_repository import MemoryQdrantRepository
-from src.infra.embedding import OpenAIEmbeddingService
+from src.infra.embedding import get_embedding_service
+
+# 쿼리 분석 패턴 (요청마다 re 모듈 캐시를 조회하지 않도록 미리 컴파일)
+TIME_REFERENCE_RE = re.compile(r'\b(오늘|어제|내일|최근|이전|언제)\b')
+EMOTION_WORD_RE = re.compile(r'\b(기쁘|슬프|화나|좋|싫)\w*\b')
+FACTUAL_QUERY_RE = re.compile(r'\b(정의|개념|사실|정보)\b')
+QUESTION_WORDS = ('뭐', '어떻', '언제', '어디')
 
 
 class MemorySearchService:
@@ -18,7 +23,7 @@ class MemorySearchService:
     
     def __init__(self):
         self.repository = MemoryQdrantRepository()
-        self.embedding_service = OpenAIEmbeddingService()
+        self.embedding_service = get_embedding_service()
     
     def search_single_collection(
         self,
@@ -26,12 +31,29 @@ class MemorySearchService:
         user_id: str,
         memory_type: MemoryType,
         limit: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        score_threshold: Optional[float] = None
     ) -> List[MemoryPoint]:
         """단일 컬렉션 검색"""
+        if not query.strip():
+            return []
         query_vector = self.embedding_service.get_embedding(query)
         return self.repository.search_memory(
-            query_vector, user_id, memory_type, limit, filters
+            query_vector, user_id, memory_type, limit, filters, score_threshold
+        )
+    
+    def search_single_collection_batch(
+        self,
+        queries: List[str],
+        user_id: str,
+        memory_type: MemoryType,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[MemoryPoint]]:
+        """여러 쿼리 단일 컬렉션 검색 (임베딩과 Qdrant 검색을 각각 한 번의 배치 요청으로 처리)"""
+        query_vectors = self.embedding_service.encode_batch(queries)
+        return self.repository.search_memory_batch(
+            query_vectors, user_id, memory_type, limit, filters
         )
     
     def search_multi_collection(
@@ -45,6 +67,8 @@ class MemorySearchService:
         """다중 컬렉션 통합 검색"""
         if collections is None:
             collections = [MemoryType.EPISODIC, MemoryType.SEMANTIC]
+        if not query.strip():
+            return []
         
         query_vector = self.embedding_service.get_embedding(query)
         return self.repository.multi_collection_search(
@@ -61,29 +85,16 @@ class MemorySearchService:
         time_weight_ratio: float = 0.3
     ) -> List[MemoryPoint]:
         """시간 가중치 검색"""
-        # 기본 검색 실행
-        results = self.search_single_collection(query, user_id, memory_type, limit * 2)
-        
-        # 시간 가중치 적용
-        reference_time = datetime.now(timezone.utc)
-        
-        for result in results:
-            if hasattr(result, 'timestamp') and result.timestamp:
-                try:
-                    memory_time = datetime.fromisoformat(result.timestamp.replace('Z', '+00:00'))
-                    time_diff_days = (reference_time - memory_time).days
-                    time_weight = np.exp(-decay_factor * time_diff_days)
-                    
-                    # 기존 점수와 시간 가중치 결합
-                    original_score = result.score if hasattr(result, 'score') else 1.0
-                    result.score = (1 - time_weight_ratio) * original_score + time_weight_ratio * time_weight
-                except:
-                    # 시간 파싱 실패 시 기본 점수 유지
-                    pass
-        
-        # 점수 기준으로 정렬하고 limit 적용
-        sorted_results = sorted(results, key=lambda x: getattr(x, 'score', 0), reverse=True)
-        return sorted_results[:limit]
+        # exp(-decay_factor * 경과일) 감쇠 = 저장소의 exp(-경과일 / decay_days) 감쇠 (decay_days = 1 / decay_factor)
+        # 후보 재채점과 상위 선택은 저장소에서 numpy 배열 연산으로 한 번에 처리
+        if not query.strip():
+            return []
+        query_vector = self.embedding_service.get_embedding(query)
+        decay_days = 1.0 / decay_factor if decay_factor > 0 else math.inf
+        return self.repository.search_memory_with_time_weight(
+            query_vector, user_id, memory_type, limit,
+            time_weight=time_weight_ratio, decay_days=decay_days
+        )
     
     def similarity_search_with_threshold(
         self,
@@ -93,16 +104,10 @@ class MemorySearchService:
         similarity_threshold: float = 0.7,
         limit: int = 10
     ) -> List[MemoryPoint]:
-        """유사도 임계값 기반 검색"""
-        results = self.search_single_collection(query, user_id, memory_type, limit * 2)
-        
-        # 임계값 이상의 결과만 필터링
-        filtered_results = [
-            result for result in results 
-            if getattr(result, 'score', 0) >= similarity_threshold
-        ]
-        
-        return filtered_results[:limit]
+        """유사도 임계값 기반 검색 (임계값 필터링은 Qdrant 서버에서 수행)"""
+        return self.search_single_collection(
+            query, user_id, memory_type, limit, score_threshold=similarity_threshold
+        )
     
     def contextual_search(
         self,
@@ -135,23 +140,18 @@ class MemorySearchService:
         limit: int = 10
     ) -> List[MemoryPoint]:
         """특정 메모리와 유사한 메모리 검색"""
-        # 참조 메모리 가져오기
-        reference_memory = self.repository.get_memory_by_id(reference_memory_id, memory_type)
-        if not reference_memory:
-            return []
-        
-        # 참조 메모리의 벡터로 검색
-        return self.repository.search_memory(
-            reference_memory.vector, user_id, memory_type, limit
+        # 저장된 참조 메모리의 벡터를 서버에서 재사용 (벡터 조회/재임베딩 불필요)
+        return self.repository.recommend_similar_memories(
+            reference_memory_id, user_id, memory_type, limit
         )
 
 
 class IntelligentSearchService:
     """지능형 검색 서비스 - 쿼리 분석 기반 최적 검색"""
     
-    def __init__(self):
-        self.search_service = MemorySearchService()
-        self.embedding_service = OpenAIEmbeddingService()
+    def __init__(self, search_service: Optional[MemorySearchService] = None):
+        self.search_service = search_service or MemorySearchService()
+        self.embedding_service = get_embedding_service()
     
     def intelligent_search(
         self,
@@ -166,8 +166,11 @@ class IntelligentSearchService:
         # 분석 결과에 따른 검색 전략 결정
         search_strategy = self._determine_search_strategy(query_analysis)
         
-        # 검색 실행
-        results = self._execute_search_strategy(query, user_id, search_strategy, limit)
+        # 검색 실행 (빈 쿼리는 임베딩/Qdrant 호출 없이 빈 결과)
+        if query.strip():
+            results = self._execute_search_strategy(query, user_id, search_strategy, limit)
+        else:
+            results = []
         
         return {
             "results": results,
@@ -178,19 +181,19 @@ class IntelligentSearchService:
     
     def _analyze_query(self, query: str) -> Dict[str, Any]:
         """쿼리 특성 분석"""
+        word_count = len(query.split())
         analysis = {
-            "has_time_reference": bool(re.search(r'\b(오늘|어제|내일|최근|이전|언제)\b', query)),
-            "has_emotion_words": bool(re.search(r'\b(기쁘|슬프|화나|좋|싫)\w*\b', query)),
-            "is_question": query.strip().endswith('?') or any(q in query for q in ['뭐', '어떻', '언제', '어디']),
-            "is_factual_query": bool(re.search(r'\b(정의|개념|사실|정보)\b', query)),
-            "query_length": len(query.split()),
-            "complexity": self._assess_query_complexity(query)
+            "has_time_reference": bool(TIME_REFERENCE_RE.search(query)),
+            "has_emotion_words": bool(EMOTION_WORD_RE.search(query)),
+            "is_question": query.strip().endswith('?') or any(q in query for q in QUESTION_WORDS),
+            "is_factual_query": bool(FACTUAL_QUERY_RE.search(query)),
+            "query_length": word_count,
+            "complexity": self._assess_query_complexity(word_count)
         }
         return analysis
     
-    def _assess_query_complexity(self, query: str) -> str:
-        """쿼리 복잡도 평가"""
-        word_count = len(query.split())
+    def _assess_query_complexity(self, word_count: int) -> str:
+        """쿼리 단어 수 기반 복잡도 평가"""
         if word_count <= 2:
             return "simple"
         elif word_count <= 5:
@@ -1,9 +1,26 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from typing import Optional
 from src.config.settings import log_config
 
+# 실제 출력(콘솔/파일)을 담당하는 백그라운드 리스너 (요청 처리 스레드가 디스크 I/O에 막히지 않도록)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener():
+    """대기 중인 로그를 모두 출력하고 리스너 종료"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 class LoggerConfig:
     """중앙화된 로거 설정 클래스"""
     
@@ -23,7 +40,10 @@ class LoggerConfig:
         if self._configured:
             return
         
-        # 기존 핸들러 제거
+        global _queue_listener
+        
+        # 기존 핸들러 및 리스너 제거
+        _stop_queue_listener()
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
@@ -34,7 +54,7 @@ class LoggerConfig:
         # 콘솔 핸들러
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # 파일 핸들러 (선택사항)
         if self.log_file:
@@ -43,9 +63,21 @@ class LoggerConfig:
             if log_dir and not os.path.exists(log_dir):
                 os.makedirs(log_dir, exist_ok=True)
             
-            file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+            file_handler = logging.handlers.RotatingFileHandler(
+                self.log_file,
+                maxBytes=log_config.log_file_max_bytes,
+                backupCount=log_config.log_file_backup_count,
+                encoding='utf-8',
+                delay=True
+            )
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # 루트 로거는 큐에 기록만 하고, 실제 출력은 리스너 스레드에서 처리
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
         
         # 루트 로거 레벨 설정
         root_logger.setLevel(self.level)
@@ -82,9 +114,8 @@ def setup_logging(
 def get_logger(name: str = None) -> logging.Logger:
     """로거 인스턴스 반환"""
     if name is None:
-        import inspect
-        frame = inspect.currentframe().f_back
-        name = frame.f_globals.get('__name__', 'unknown')
+        # inspect 모듈 대신 호출자 프레임을 직접 조회 (logging.getLogger가 이름별 로거를 캐시)
+        name = sys._getframe(1).f_globals.get('__name__', 'unknown')
     
     return logging.getLogger(name)
 
@@ -1,36 +1,99 @@
 import psutil
 import platform
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Callable, Optional, Tuple
 from src.utils.logger import get_logger
+from src.config.settings import server_config
 
 logger = get_logger(__name__)
 
+# 현재 프로세스 핸들 (cpu_percent는 직전 호출 대비 사용률이므로 같은 객체를 재사용)
+_PROCESS = psutil.Process()
+
+# 비차단 CPU 사용률 측정 기준점 설정 (이후 호출은 직전 호출 이후 구간의 사용률 반환)
+psutil.cpu_percent(interval=None)
+_PROCESS.cpu_percent(interval=None)
+
+# 항목별 수집을 동시에 실행하기 위한 스레드 풀 (psutil의 /proc 읽기는 GIL을 해제)
+_info_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="system-info")
+
+# 수집 결과 캐시 (짧은 주기의 폴링/헬스체크가 매번 전체 수집을 반복하지 않도록)
+_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cached(key: str, collect: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """TTL 동안 수집 결과 재사용 (동시 요청은 잠금으로 한 번만 수집, 호출자에게는 복사본 반환)"""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            entry = (time.monotonic() + server_config.system_info_cache_ttl, collect())
+            _cache[key] = entry
+        return dict(entry[1])
+
+
+@lru_cache(maxsize=1)
+def _detect_container() -> Tuple[bool, Optional[str]]:
+    """Docker 실행 여부와 컨테이너 ID (프로세스 수명 동안 바뀌지 않으므로 한 번만 확인)"""
+    is_docker = False
+    container_id = None
+    
+    try:
+        # Docker 환경 확인
+        if os.path.exists('/.dockerenv'):
+            is_docker = True
+        
+        # 컨테이너 ID 확인 (cgroup에서)
+        if os.path.exists('/proc/self/cgroup'):
+            with open('/proc/self/cgroup', 'r') as f:
+                for line in f:
+                    if 'docker' in line:
+                        parts = line.strip().split('/')
+                        if len(parts) > 2:
+                            container_id = parts[-1][:12]  # 짧은 ID
+                        break
+        
+    except Exception as e:
+        logger.debug(f"Docker 정보 수집 중 오류: {e}")
+    
+    return is_docker, container_id
+
 
 class SystemInfoCollector:
     """시스템 정보 수집 클래스"""
     
     @staticmethod
     def get_system_info() -> Dict[str, Any]:
-        """전체 시스템 정보 수집"""
-        try:
-            return {
-                "timestamp": datetime.now().isoformat(),
-                "system": SystemInfoCollector._get_system_info(),
-                "cpu": SystemInfoCollector._get_cpu_info(),
-                "memory": SystemInfoCollector._get_memory_info(),
-                "disk": SystemInfoCollector._get_disk_info(),
-                "network": SystemInfoCollector._get_network_info(),
-                "process": SystemInfoCollector._get_process_info(),
-                "docker": SystemInfoCollector._get_docker_info()
-            }
-        except Exception as e:
-            logger.error(f"시스템 정보 수집 중 오류 발생: {e}")
-            return {
-                "timestamp": datetime.now().isoformat(),
-                "error": f"시스템 정보 수집 실패: {str(e)}"
-            }
+        """전체 시스템 정보 수집 (짧은 TTL 캐시 적용)"""
+        return _cached("system_info", SystemInfoCollector._collect_system_info)
+    
+    @staticmethod
+    def _collect_system_info() -> Dict[str, Any]:
+        """전체 시스템 정보 수집 (항목별 동시 수집, 실패한 항목만 오류로 표시)"""
+        sections = {
+            "system": SystemInfoCollector._get_system_info,
+            "cpu": SystemInfoCollector._get_cpu_info,
+            "memory": SystemInfoCollector._get_memory_info,
+            "disk": SystemInfoCollector._get_disk_info,
+            "network": SystemInfoCollector._get_network_info,
+            "process": SystemInfoCollector._get_process_info,
+            "docker": SystemInfoCollector._get_docker_info
+        }
+        futures = {name: _info_executor.submit(collect) for name, collect in sections.items()}
+        
+        system_info = {"timestamp": datetime.now().isoformat()}
+        for name, future in futures.items():
+            try:
+                system_info[name] = future.result()
+            except Exception as e:
+                logger.error(f"시스템 정보 수집 중 오류 발생 ({name}): {e}")
+                system_info[name] = {"error": f"{name} 정보 수집 실패: {str(e)}"}
+        return system_info
     
     @staticmethod
     def _get_system_info() -> Dict[str, Any]:
@@ -47,7 +110,8 @@ class SystemInfoCollector:
     @staticmethod
     def _get_cpu_info() -> Dict[str, Any]:
         """CPU 정보"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # 1초 차단 측정 대신 직전 호출 이후 구간의 사용률 사용
+        cpu_percent = psutil.cpu_percent(interval=None)
         cpu_count = psutil.cpu_count()
         cpu_freq = psutil.cpu_freq()
         
@@ -109,7 +173,7 @@ class SystemInfoCollector:
     @staticmethod
     def _get_process_info() -> Dict[str, Any]:
         """현재 프로세스 정보"""
-        current_process = psutil.Process()
+        current_process = _PROCESS
         
         return {
             "pid": current_process.pid,
@@ -124,41 +188,25 @@ class SystemInfoCollector:
     @staticmethod
     def _get_docker_info() -> Dict[str, Any]:
         """Docker 환경 정보"""
-        docker_info = {
-            "is_docker": False,
-            "container_id": None,
-            "image": None
-        }
-        
-        try:
-            # Docker 환경 확인
-            if os.path.exists('/.dockerenv'):
-                docker_info["is_docker"] = True
-            
-            # 컨테이너 ID 확인 (cgroup에서)
-            if os.path.exists('/proc/self/cgroup'):
-                with open('/proc/self/cgroup', 'r') as f:
-                    for line in f:
-                        if 'docker' in line:
-                            parts = line.strip().split('/')
-                            if len(parts) > 2:
-                                docker_info["container_id"] = parts[-1][:12]  # 짧은 ID
-                            break
-            
+        is_docker, container_id = _detect_container()
+        return {
+            "is_docker": is_docker,
+            "container_id": container_id,
             # 환경변수에서 Docker 정보 확인
-            docker_info["image"] = os.getenv('DOCKER_IMAGE', None)
-            
-        except Exception as e:
-            logger.debug(f"Docker 정보 수집 중 오류: {e}")
-        
-        return docker_info
+            "image": os.getenv('DOCKER_IMAGE', None)
+        }
     
     @staticmethod
     def get_simple_status() -> Dict[str, Any]:
-        """간단한 상태 정보 (헬스체크용)"""
+        """간단한 상태 정보 (헬스체크용, 짧은 TTL 캐시 적용)"""
+        return _cached("simple_status", SystemInfoCollector._collect_simple_status)
+    
+    @staticmethod
+    def _collect_simple_status() -> Dict[str, Any]:
+        """간단한 상태 정보 수집"""
         try:
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             return {
                 "status": "healthy",
@@ -1,15 +1,26 @@
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 import math
 import re
 
+# 소수점 이하 초 자릿수가 6자리가 아닌 ISO 시간 문자열 패턴
+_FRACTION_RE = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)([+-]\d{2}:\d{2}|Z?)$')
+
+@lru_cache(maxsize=4096)
 def parse_iso_time(time_str: str) -> datetime:
-    """ISO 형식의 시간 문자열을 datetime 객체로 변환."""
+    """ISO 형식의 시간 문자열을 datetime 객체로 변환 (같은 문자열이 반복 조회되므로 결과 캐시)."""
     if time_str.endswith('Z'):
         time_str = time_str[:-1] + '+00:00'
     
-    # 마이크로초가 6자리 이상인 경우 처리
-    pattern = r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\.(\d+)([+-]\d{2}:\d{2}|Z?)$'
-    match = re.match(pattern, time_str)
+    # isoformat()으로 저장된 일반적인 문자열은 정규식 없이 바로 파싱
+    try:
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        pass
+    
+    # 마이크로초가 6자리가 아닌 경우 처리
+    match = _FRACTION_RE.match(time_str)
     
     if match:
         base_time = match.group(1)
@@ -31,6 +42,18 @@ def parse_iso_time(time_str: str) -> datetime:
     
     return datetime.fromisoformat(time_str)
 
+def parse_epoch(time_str: Optional[str]) -> Optional[float]:
+    """ISO 형식의 시간 문자열을 epoch 초로 변환 (없거나 파싱 불가, 시간대 정보가 없으면 None)."""
+    if not time_str:
+        return None
+    try:
+        parsed = parse_iso_time(time_str)
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return parsed.timestamp()
+
 def calculate_time_weight(insert_time: datetime, reference_time: datetime, time_weight: float) -> float:
     """시간 가중치 계산."""
     if time_weight == 0.0:
@@ -3,15 +3,56 @@
 다중 컬렉션 Memory Server API 테스트
 """
 
+import atexit
 import requests
-import json
-import time
-from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 서버 설정
-BASE_URL = "http://localhost:5602"
+# localhost 이름 해석(및 IPv6 우선 시도) 없이 바로 IPv4 루프백으로 연결
+BASE_URL = "http://127.0.0.1:5602"
 USER_ID = "test_user_001"
 
+# API 엔드포인트 및 공통 헤더
+HEALTH_URL = f"{BASE_URL}/health"
+MEMORY_URL = f"{BASE_URL}/api/memory"
+EPISODIC_URL = f"{BASE_URL}/api/memory/episodic"
+SEMANTIC_URL = f"{BASE_URL}/api/memory/semantic"
+EPISODIC_SEARCH_URL = f"{BASE_URL}/api/memory/episodic/search"
+SEMANTIC_SEARCH_URL = f"{BASE_URL}/api/memory/semantic/search"
+MULTI_SEARCH_URL = f"{BASE_URL}/api/memory/search/multi"
+CLASSIFY_URL = f"{BASE_URL}/api/classify"
+USER_STATS_URL = f"{BASE_URL}/api/user/{USER_ID}/stats"
+SYSTEM_STATS_URL = f"{BASE_URL}/api/system/stats"
+USER_HEADERS = {"X-User-ID": USER_ID}
+
+# 모든 요청이 keep-alive 연결을 재사용하도록 공유 세션 사용
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+atexit.register(SESSION.close)
+# 서로 독립적인 삽입 요청을 동시에 보낼 때의 최대 동시 요청 수
+MAX_PARALLEL_REQUESTS = 8
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def post_json(url, data, **kwargs):
+    """JSON 본문 POST 요청 (orjson이 설치되어 있으면 orjson으로 인코딩)"""
+    if orjson is None:
+        return SESSION.post(url, json=data, **kwargs)
+    return SESSION.post(url, data=orjson.dumps(data), headers=JSON_HEADERS, **kwargs)
+
+
+def parse_json(response):
+    """응답 본문 JSON 디코딩 (orjson이 설치되어 있으면 orjson 사용)"""
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
 def test_auto_classification():
     """자동 분류 테스트"""
     print("\n=== 자동 분류 테스트 ===")
@@ -62,31 +103,30 @@ def test_auto_classification():
         }
     ]
     
-    for i, test_case in enumerate(test_cases):
-        print(f"\n테스트 {i+1}: {test_case['text']}")
-        
-        # 자동 분류로 메모리 삽입
-        insert_data = {
-            "text": test_case["text"],
+    # 삽입 요청 데이터는 케이스 정의(expected_type 제외)에 공통 필드만 더해 미리 생성
+    insert_payloads = [
+        {
+            **{key: value for key, value in test_case.items() if key != "expected_type"},
             "user_id": USER_ID,
             "importance_score": 0.7,
             "source": "test_auto_classification"
         }
-        
-        # 타입별 특화 데이터 추가
-        if "speaker" in test_case:
-            insert_data["speaker"] = test_case["speaker"]
-        if "emotion" in test_case:
-            insert_data["emotion"] = test_case["emotion"]
-        if "context" in test_case:
-            insert_data["context"] = test_case["context"]
-        if "fact_type" in test_case:
-            insert_data["fact_type"] = test_case["fact_type"]
-            
-        response = requests.post(f"{BASE_URL}/api/memory", json=insert_data)
+        for test_case in test_cases
+    ]
+    
+    # 모든 케이스를 동시에 삽입하고, 결과는 케이스 순서대로 출력
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        futures = [
+            executor.submit(post_json, MEMORY_URL, payload)
+            for payload in insert_payloads
+        ]
+    
+    for i, (test_case, future) in enumerate(zip(test_cases, futures)):
+        print(f"\n테스트 {i+1}: {test_case['text']}")
+        response = future.result()
         
         if response.status_code == 200:
-            result = response.json()
+            result = parse_json(response)
             predicted_type = result["memory_type"]
             confidence = result.get("classification_confidence", 0)
             explanation = result.get("classification_explanation", "")
@@ -107,7 +147,7 @@ def test_manual_classification():
     """수동 분류 테스트"""
     print("\n=== 수동 분류 테스트 ===")
     
-    # Episodic 메모리 직접 삽입
+    # Episodic / Semantic 메모리 직접 삽입
     episodic_data = {
         "text": "방금 전에 비가 오기 시작했어",
         "user_id": USER_ID,
@@ -127,14 +167,6 @@ def test_manual_classification():
         "source": "test_manual"
     }
     
-    response = requests.post(f"{BASE_URL}/api/memory/episodic", json=episodic_data)
-    if response.status_code == 200:
-        result = response.json()
-        print(f"Episodic 메모리 삽입 성공: {result['id']}")
-    else:
-        print(f"Episodic 메모리 삽입 실패: {response.status_code}")
-    
-    # Semantic 메모리 직접 삽입
     semantic_data = {
         "text": "우리 회사 주소는 서울시 강남구 테헤란로 123번길이다",
         "user_id": USER_ID,
@@ -144,9 +176,21 @@ def test_manual_classification():
         "source": "test_manual"
     }
     
-    response = requests.post(f"{BASE_URL}/api/memory/semantic", json=semantic_data)
+    # 두 삽입 요청은 서로 독립적이므로 동시에 전송
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        episodic_future = executor.submit(post_json, EPISODIC_URL, episodic_data)
+        semantic_future = executor.submit(post_json, SEMANTIC_URL, semantic_data)
+    
+    response = episodic_future.result()
+    if response.status_code == 200:
+        result = parse_json(response)
+        print(f"Episodic 메모리 삽입 성공: {result['id']}")
+    else:
+        print(f"Episodic 메모리 삽입 실패: {response.status_code}")
+    
+    response = semantic_future.result()
     if response.status_code == 200:
-        result = response.json()
+        result = parse_json(response)
         print(f"Semantic 메모리 삽입 성공: {result['id']}")
     else:
         print(f"Semantic 메모리 삽입 실패: {response.status_code}")
@@ -163,40 +207,43 @@ def test_search():
         "비"
     ]
     
-    for query in test_queries:
+    def search_all(executor, query):
+        """한 쿼리에 대한 Episodic / Semantic / 통합 검색을 동시에 요청"""
+        params = {"query": query, "limit": 3}
+        multi_params = {**params, "episodic_weight": 1.0, "semantic_weight": 1.0}
+        return (
+            executor.submit(SESSION.get, EPISODIC_SEARCH_URL, headers=USER_HEADERS, params=params),
+            executor.submit(SESSION.get, SEMANTIC_SEARCH_URL, headers=USER_HEADERS, params=params),
+            executor.submit(SESSION.get, MULTI_SEARCH_URL, headers=USER_HEADERS, params=multi_params)
+        )
+    
+    # 모든 쿼리의 검색 요청을 먼저 보내고, 결과는 쿼리 순서대로 출력
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        query_futures = [(query, search_all(executor, query)) for query in test_queries]
+    
+    for query, (episodic_future, semantic_future, multi_future) in query_futures:
         print(f"\n쿼리: '{query}'")
         
         # 단일 컬렉션 검색 (Episodic)
-        headers = {"X-User-ID": USER_ID}
-        params = {"query": query, "limit": 3}
-        
-        response = requests.get(f"{BASE_URL}/api/memory/episodic/search", 
-                               headers=headers, params=params)
+        response = episodic_future.result()
         if response.status_code == 200:
-            results = response.json()
+            results = parse_json(response)
             print(f"   Episodic 검색 결과: {len(results)}개")
             for i, result in enumerate(results):
                 print(f"     {i+1}. {result['text'][:50]}... (점수: {result['score']:.3f})")
         
         # 단일 컬렉션 검색 (Semantic)  
-        response = requests.get(f"{BASE_URL}/api/memory/semantic/search", 
-                               headers=headers, params=params)
+        response = semantic_future.result()
         if response.status_code == 200:
-            results = response.json()
+            results = parse_json(response)
             print(f"   Semantic 검색 결과: {len(results)}개")
             for i, result in enumerate(results):
                 print(f"     {i+1}. {result['text'][:50]}... (점수: {result['score']:.3f})")
         
         # 다중 컬렉션 통합 검색
-        params.update({
-            "episodic_weight": 1.0,
-            "semantic_weight": 1.0
-        })
-        
-        response = requests.get(f"{BASE_URL}/api/memory/search/multi", 
-                               headers=headers, params=params)
+        response = multi_future.result()
         if response.status_code == 200:
-            result = response.json()
+            result = parse_json(response)
             print(f"   통합 검색 결과: {result['total_results']}개")
             print(f"   컬렉션별 분포: {result['collection_stats']}")
             print(f"   검색 시간: {result['query_time_ms']:.1f}ms")
@@ -215,11 +262,14 @@ def test_classification_api():
         "내 취미는 독서와 영화감상이다"
     ]
     
-    for text in test_texts:
-        response = requests.post(f"{BASE_URL}/api/classify", 
-                                params={"text": text})
+    # 분류 요청을 동시에 보내고, 결과는 텍스트 순서대로 출력
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        futures = [executor.submit(SESSION.post, CLASSIFY_URL, params={"text": text}) for text in test_texts]
+    
+    for text, future in zip(test_texts, futures):
+        response = future.result()
         if response.status_code == 200:
-            result = response.json()
+            result = parse_json(response)
             print(f"\n텍스트: {text}")
             print(f"분류: {result['predicted_type']} (신뢰도: {result['confidence']:.2f})")
             print(f"점수 - Episodic: {result['episodic_score']}, Semantic: {result['semantic_score']}")
@@ -229,9 +279,9 @@ def test_user_stats():
     """사용자 통계 테스트"""
     print("\n=== 사용자 통계 테스트 ===")
     
-    response = requests.get(f"{BASE_URL}/api/user/{USER_ID}/stats")
+    response = SESSION.get(USER_STATS_URL)
     if response.status_code == 200:
-        stats = response.json()
+        stats = parse_json(response)
         print(f"사용자: {stats['user_id']}")
         print(f"전체 메모리 수: {stats['total_memories']}")
         print(f"Episodic 메모리: {stats['episodic_count']}")
@@ -243,9 +293,9 @@ def test_system_stats():
     """시스템 통계 테스트"""
     print("\n=== 시스템 통계 테스트 ===")
     
-    response = requests.get(f"{BASE_URL}/api/system/stats")
+    response = SESSION.get(SYSTEM_STATS_URL)
     if response.status_code == 200:
-        stats = response.json()
+        stats = parse_json(response)
         print(f"전체 컬렉션: {stats['total_collections']}")
         print(f"전체 사용자: {stats['total_users']}")
         print(f"전체 메모리: {stats['total_memories']}")
@@ -260,13 +310,17 @@ def main():
     
     try:
         # 서버 연결 확인
-        response = requests.get(f"{BASE_URL}/health")
+        response = SESSION.get(HEALTH_URL)
         if response.status_code != 200:
             print("❌ 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
             return
         
         print("✅ 서버 연결 확인")
         
+        # 동시 요청 수만큼 연결을 미리 열어 두어 첫 병렬 요청의 연결 지연 제거
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            list(executor.map(lambda _: SESSION.get(HEALTH_URL), range(MAX_PARALLEL_REQUESTS)))
+        
         # 테스트 실행
         test_auto_classification()
         test_manual_classification()
@@ -11,24 +11,71 @@ import time
 import random
 import os
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 실패 로그에 기록할 오류 응답 본문 최대 바이트 수
+ERROR_BODY_LIMIT = 1024
+
 class ComprehensiveMemoryServerTest:
+    # 삽입 테스트 항목에 공통으로 붙는 필드 (항목별 데이터가 덮어씀)
+    EPISODIC_TEMPLATE = {"context": None, "importance_score": 0.8, "source": "test"}
+    SEMANTIC_TEMPLATE = {"importance_score": 0.7, "source": "test"}
+    
     def __init__(self, base_url: str = "http://localhost:5602"):
         self.base_url = base_url
         self.test_user_id = f"test_user_{int(time.time())}"
         self.session = None
+        self.request_semaphore = None
         self.test_results = []
         
     async def create_session(self):
         """HTTP 세션 생성"""
-        self.session = aiohttp.ClientSession()
+        # 테스트 전체에서 keep-alive 연결을 재사용하도록 커넥터 설정
+        connector = aiohttp.TCPConnector(limit_per_host=32, keepalive_timeout=75, enable_cleanup_closed=True)
+        session_options = {}
+        if orjson is not None:
+            # 요청 본문 직렬화에 orjson 사용 (aiohttp는 문자열을 기대)
+            session_options["json_serialize"] = lambda obj: orjson.dumps(obj).decode()
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"X-User-ID": self.test_user_id},
+            **session_options
+        )
+        # 동시 요청 수 제한 (서버가 과부하로 타임아웃되지 않도록)
+        self.request_semaphore = asyncio.Semaphore(16)
         
     async def close_session(self):
         """HTTP 세션 종료"""
         if self.session:
             await self.session.close()
+    
+    @staticmethod
+    async def read_error_body(response) -> str:
+        """오류 응답 본문은 로그에 필요한 앞부분만 읽음 (큰 오류 페이지 전체를 읽고 디코딩하지 않도록)"""
+        return (await response.content.read(ERROR_BODY_LIMIT)).decode("utf-8", errors="replace")
+    
+    async def fetch(self, method: str, url: str, **kwargs):
+        """요청 전송 후 (상태 코드, 성공 시 JSON 본문 / 실패 시 응답 텍스트) 반환"""
+        async with self.request_semaphore:
+            async with self.session.request(method, url, **kwargs) as response:
+                if response.status == 200:
+                    if orjson is not None:
+                        return response.status, orjson.loads(await response.read())
+                    return response.status, await response.json()
+                return response.status, await self.read_error_body(response)
+    
+    async def fetch_all(self, requests: List[Tuple[str, str, Dict[str, Any]]]):
+        """서로 독립적인 (method, url, kwargs) 요청들을 동시에 전송 (결과는 요청 순서대로, 실패한 요청은 예외 객체)"""
+        return await asyncio.gather(
+            *(self.fetch(method, url, **kwargs) for method, url, kwargs in requests),
+            return_exceptions=True
+        )
             
     def log_result(self, test_name: str, success: bool, message: str = "", data: Any = None):
         """테스트 결과 로깅"""
@@ -100,38 +147,8 @@ class ComprehensiveMemoryServerTest:
             }
         ]
         
-        inserted_ids = []
-        for i, data in enumerate(test_data):
-            try:
-                payload = {
-                    "text": data["text"],
-                    "user_id": self.test_user_id,
-                    "speaker": data["speaker"],
-                    "emotion": data["emotion"],
-                    "context": data.get("context"),
-                    "importance_score": 0.8,
-                    "source": "test"
-                }
-                
-                async with self.session.post(
-                    f"{self.base_url}/api/memory/episodic",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        inserted_ids.append(result["id"])
-                        self.log_result(f"Episodic Insert {i+1}", True, 
-                                      f"ID: {result['id']}, Type: {result['memory_type']}")
-                    else:
-                        error_data = await response.text()
-                        self.log_result(f"Episodic Insert {i+1}", False, 
-                                      f"Status: {response.status}", error_data)
-                        
-            except Exception as e:
-                self.log_result(f"Episodic Insert {i+1}", False, f"Exception: {str(e)}")
-        
-        return inserted_ids
+        memories = [{**self.EPISODIC_TEMPLATE, **data} for data in test_data]
+        return await self.batch_insert("Episodic Insert", "episodic", memories)
     
     async def test_semantic_memory_insertion(self):
         """Semantic 메모리 삽입 테스트"""
@@ -158,35 +175,27 @@ class ComprehensiveMemoryServerTest:
             }
         ]
         
+        memories = [{**self.SEMANTIC_TEMPLATE, **data} for data in test_data]
+        return await self.batch_insert("Semantic Insert", "semantic", memories)
+    
+    async def batch_insert(self, test_name: str, memory_type: str, memories: List[Dict[str, Any]]):
+        """지정한 타입의 메모리 목록을 배치 삽입 API 한 번으로 삽입하고 항목별 결과 기록"""
         inserted_ids = []
-        for i, data in enumerate(test_data):
-            try:
-                payload = {
-                    "text": data["text"],
-                    "user_id": self.test_user_id,
-                    "fact_type": data["fact_type"],
-                    "confidence_score": data["confidence_score"],
-                    "importance_score": 0.7,
-                    "source": "test"
-                }
+        try:
+            status, result = await self.fetch(
+                "POST", f"{self.base_url}/api/memory/batch",
+                json={"user_id": self.test_user_id, "memory_type": memory_type, "memories": memories}
+            )
+            if status == 200:
+                for i, item in enumerate(result["results"]):
+                    inserted_ids.append(item["id"])
+                    self.log_result(f"{test_name} {i+1}", True,
+                                  f"ID: {item['id']}, Type: {item['memory_type']}")
+            else:
+                self.log_result(test_name, False, f"Status: {status}", result)
                 
-                async with self.session.post(
-                    f"{self.base_url}/api/memory/semantic",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        inserted_ids.append(result["id"])
-                        self.log_result(f"Semantic Insert {i+1}", True,
-                                      f"ID: {result['id']}, Type: {result['memory_type']}")
-                    else:
-                        error_data = await response.text()
-                        self.log_result(f"Semantic Insert {i+1}", False,
-                                      f"Status: {response.status}", error_data)
-                        
-            except Exception as e:
-                self.log_result(f"Semantic Insert {i+1}", False, f"Exception: {str(e)}")
+        except Exception as e:
+            self.log_result(test_name, False, f"Exception: {str(e)}")
         
         return inserted_ids
     
@@ -200,36 +209,35 @@ class ComprehensiveMemoryServerTest:
             {"text": "오늘 아침에 일어나보니 눈이 많이 쌓여있었어.", "expected": "episodic"}
         ]
         
-        for i, case in enumerate(test_cases):
+        responses = await self.fetch_all([
+            ("POST", f"{self.base_url}/api/memory", {"json": {
+                "text": case["text"],
+                "user_id": self.test_user_id,
+                "importance_score": 0.6,
+                "source": "auto_classification_test"
+            }})
+            for case in test_cases
+        ])
+        
+        for i, (case, response) in enumerate(zip(test_cases, responses)):
             try:
-                payload = {
-                    "text": case["text"],
-                    "user_id": self.test_user_id,
-                    "importance_score": 0.6,
-                    "source": "auto_classification_test"
-                }
-                
-                async with self.session.post(
-                    f"{self.base_url}/api/memory",
-                    json=payload,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        classified_type = result["memory_type"]
-                        confidence = result.get("classification_confidence", 0.0)
-                        explanation = result.get("classification_explanation", "")
-                        
-                        success = classified_type == case["expected"]
-                        self.log_result(f"Auto Classification {i+1}", success,
-                                      f"Text: '{case['text'][:30]}...' -> {classified_type} (confidence: {confidence:.2f})")
-                        if not success:
-                            print(f"   Expected: {case['expected']}, Got: {classified_type}")
-                            print(f"   Explanation: {explanation}")
-                    else:
-                        error_data = await response.text()
-                        self.log_result(f"Auto Classification {i+1}", False,
-                                      f"Status: {response.status}", error_data)
+                if isinstance(response, Exception):
+                    raise response
+                status, result = response
+                if status == 200:
+                    classified_type = result["memory_type"]
+                    confidence = result.get("classification_confidence", 0.0)
+                    explanation = result.get("classification_explanation", "")
+                    
+                    success = classified_type == case["expected"]
+                    self.log_result(f"Auto Classification {i+1}", success,
+                                  f"Text: '{case['text'][:30]}...' -> {classified_type} (confidence: {confidence:.2f})")
+                    if not success:
+                        print(f"   Expected: {case['expected']}, Got: {classified_type}")
+                        print(f"   Explanation: {explanation}")
+                else:
+                    self.log_result(f"Auto Classification {i+1}", False,
+                                  f"Status: {status}", result)
                         
             except Exception as e:
                 self.log_result(f"Auto Classification {i+1}", False, f"Exception: {str(e)}")
@@ -243,26 +251,28 @@ class ComprehensiveMemoryServerTest:
             {"type": "semantic", "query": "파리", "min_results": 1}
         ]
         
-        for test in search_tests:
+        responses = await self.fetch_all([
+            ("GET", f"{self.base_url}/api/memory/{test['type']}/search",
+             {"params": {"query": test["query"], "limit": 10}})
+            for test in search_tests
+        ])
+        
+        for test, response in zip(search_tests, responses):
             try:
-                async with self.session.get(
-                    f"{self.base_url}/api/memory/{test['type']}/search",
-                    params={"query": test["query"], "limit": 10},
-                    headers={"X-User-ID": self.test_user_id}
-                ) as response:
-                    if response.status == 200:
-                        results = await response.json()
-                        success = len(results) >= test["min_results"]
-                        self.log_result(f"Search {test['type']} - {test['query']}", success,
-                                      f"Found {len(results)} results (expected >= {test['min_results']})")
-                        
-                        # 결과 상세 정보 출력
-                        for i, result in enumerate(results[:2]):  # 처음 2개만 출력
-                            print(f"   Result {i+1}: {result['text'][:50]}... (score: {result['score']:.3f})")
-                    else:
-                        error_data = await response.text()
-                        self.log_result(f"Search {test['type']} - {test['query']}", False,
-                                      f"Status: {response.status}", error_data)
+                if isinstance(response, Exception):
+                    raise response
+                status, results = response
+                if status == 200:
+                    success = len(results) >= test["min_results"]
+                    self.log_result(f"Search {test['type']} - {test['query']}", success,
+                                  f"Found {len(results)} results (expected >= {test['min_results']})")
+                    
+                    # 결과 상세 정보 출력
+                    for i, result in enumerate(results[:2]):  # 처음 2개만 출력
+                        print(f"   Result {i+1}: {result['text'][:50]}... (score: {result['score']:.3f})")
+                else:
+                    self.log_result(f"Search {test['type']} - {test['query']}", False,
+                                  f"Status: {status}", results)
                         
             except Exception as e:
                 self.log_result(f"Search {test['type']} - {test['query']}", False, f"Exception: {str(e)}")
@@ -271,41 +281,40 @@ class ComprehensiveMemoryServerTest:
         """다중 컬렉션 검색 테스트"""
         search_queries = ["친구", "생일", "영화", "파리"]
         
-        for query in search_queries:
+        responses = await self.fetch_all([
+            ("GET", f"{self.base_url}/api/memory/search/multi", {"params": {
+                "query": query,
+                "limit": 10,
+                "episodic_weight": 1.2,
+                "semantic_weight": 0.8
+            }})
+            for query in search_queries
+        ])
+        
+        for query, response in zip(search_queries, responses):
             try:
-                params = {
-                    "query": query,
-                    "limit": 10,
-                    "episodic_weight": 1.2,
-                    "semantic_weight": 0.8
-                }
-                
-                async with self.session.get(
-                    f"{self.base_url}/api/memory/search/multi",
-                    params=params,
-                    headers={"X-User-ID": self.test_user_id}
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        total_results = result["total_results"]
-                        collection_stats = result["collection_stats"]
-                        query_time = result["query_time_ms"]
-                        
-                        self.log_result(f"Multi Search - {query}", True,
-                                      f"Found {total_results} results in {query_time:.2f}ms")
-                        print(f"   Collection stats: {collection_stats}")
-                        
-                        # 결과 타입별 분포 확인
-                        if result["results"]:
-                            types_count = {}
-                            for res in result["results"]:
-                                mem_type = res["memory_type"]
-                                types_count[mem_type] = types_count.get(mem_type, 0) + 1
-                            print(f"   Type distribution: {types_count}")
-                    else:
-                        error_data = await response.text()
-                        self.log_result(f"Multi Search - {query}", False,
-                                      f"Status: {response.status}", error_data)
+                if isinstance(response, Exception):
+                    raise response
+                status, result = response
+                if status == 200:
+                    total_results = result["total_results"]
+                    collection_stats = result["collection_stats"]
+                    query_time = result["query_time_ms"]
+                    
+                    self.log_result(f"Multi Search - {query}", True,
+                                  f"Found {total_results} results in {query_time:.2f}ms")
+                    print(f"   Collection stats: {collection_stats}")
+                    
+                    # 결과 타입별 분포 확인
+                    if result["results"]:
+                        types_count = {}
+                        for res in result["results"]:
+                            mem_type = res["memory_type"]
+                            types_count[mem_type] = types_count.get(mem_type, 0) + 1
+                        print(f"   Type distribution: {types_count}")
+                else:
+                    self.log_result(f"Multi Search - {query}", False,
+                                  f"Status: {status}", result)
                         
             except Exception as e:
                 self.log_result(f"Multi Search - {query}", False, f"Exception: {str(e)}")
@@ -325,7 +334,7 @@ class ComprehensiveMemoryServerTest:
                     print(f"   Daily average: {stats.get('daily_average', 0):.2f}")
                     print(f"   Most active day: {stats.get('most_active_day', 'N/A')}")
                 else:
-                    error_data = await response.text()
+                    error_data = await self.read_error_body(response)
                     self.log_result("User Statistics", False,
                                   f"Status: {response.status}", error_data)
                     
@@ -335,23 +344,21 @@ class ComprehensiveMemoryServerTest:
     async def test_system_statistics(self):
         """시스템 통계 테스트"""
         try:
-            async with self.session.get(f"{self.base_url}/api/system/stats") as response:
-                if response.status == 200:
-                    stats = await response.json()
-                    self.log_result("System Statistics", True,
-                                  f"Collections: {stats['total_collections']}, "
-                                  f"Users: {stats['total_users']}, "
-                                  f"Memories: {stats['total_memories']}")
-                    
-                    # 컬렉션별 통계 출력
-                    for collection in stats.get('collections', []):
-                        print(f"   Collection {collection['name']}: "
-                              f"{collection['total_points']} points, "
-                              f"{collection['user_count']} users")
-                else:
-                    error_data = await response.text()
-                    self.log_result("System Statistics", False,
-                                  f"Status: {response.status}", error_data)
+            status, stats = await self.fetch("GET", f"{self.base_url}/api/system/stats")
+            if status == 200:
+                self.log_result("System Statistics", True,
+                              f"Collections: {stats['total_collections']}, "
+                              f"Users: {stats['total_users']}, "
+                              f"Memories: {stats['total_memories']}")
+                
+                # 컬렉션별 통계 출력
+                for collection in stats.get('collections', []):
+                    print(f"   Collection {collection['name']}: "
+                          f"{collection['total_points']} points, "
+                          f"{collection['user_count']} users")
+            else:
+                self.log_result("System Statistics", False,
+                              f"Status: {status}", stats)
                     
         except Exception as e:
             self.log_result("System Statistics", False, f"Exception: {str(e)}")
@@ -365,27 +372,27 @@ class ComprehensiveMemoryServerTest:
             "내 취미는 독서와 영화감상이다"
         ]
         
-        for i, text in enumerate(test_texts):
+        responses = await self.fetch_all([
+            ("POST", f"{self.base_url}/api/classify", {"params": {"text": text}})
+            for text in test_texts
+        ])
+        
+        for i, (text, response) in enumerate(zip(test_texts, responses)):
             try:
-                params = {"text": text}
-                
-                async with self.session.post(
-                    f"{self.base_url}/api/classify",
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        predicted_type = result["predicted_type"]
-                        confidence = result["confidence"]
-                        explanation = result["explanation"]
-                        
-                        self.log_result(f"Classification API {i+1}", True,
-                                      f"'{text[:30]}...' -> {predicted_type} ({confidence:.2f})")
-                        print(f"   Explanation: {explanation}")
-                    else:
-                        error_data = await response.text()
-                        self.log_result(f"Classification API {i+1}", False,
-                                      f"Status: {response.status}", error_data)
+                if isinstance(response, Exception):
+                    raise response
+                status, result = response
+                if status == 200:
+                    predicted_type = result["predicted_type"]
+                    confidence = result["confidence"]
+                    explanation = result["explanation"]
+                    
+                    self.log_result(f"Classification API {i+1}", True,
+                                  f"'{text[:30]}...' -> {predicted_type} ({confidence:.2f})")
+                    print(f"   Explanation: {explanation}")
+                else:
+                    self.log_result(f"Classification API {i+1}", False,
+                                  f"Status: {status}", result)
                         
             except Exception as e:
                 self.log_result(f"Classification API {i+1}", False, f"Exception: {str(e)}")
@@ -395,16 +402,15 @@ class ComprehensiveMemoryServerTest:
         # 현재는 초기화만 테스트 (실제 운영에서는 위험할 수 있음)
         try:
             # 컬렉션 상태 확인을 위한 시스템 통계 호출
-            async with self.session.get(f"{self.base_url}/api/system/stats") as response:
-                if response.status == 200:
-                    stats = await response.json()
-                    self.log_result("Collection Status Check", True,
-                                  f"Found {stats['total_collections']} collections")
-                    
-                    for collection in stats.get('collections', []):
-                        print(f"   {collection['name']}: {collection['total_points']} points")
-                else:
-                    self.log_result("Collection Status Check", False, f"Status: {response.status}")
+            status, stats = await self.fetch("GET", f"{self.base_url}/api/system/stats")
+            if status == 200:
+                self.log_result("Collection Status Check", True,
+                              f"Found {stats['total_collections']} collections")
+                
+                for collection in stats.get('collections', []):
+                    print(f"   {collection['name']}: {collection['total_points']} points")
+            else:
+                self.log_result("Collection Status Check", False, f"Status: {status}")
                     
         except Exception as e:
             self.log_result("Collection Status Check", False, f"Exception: {str(e)}")
@@ -467,13 +473,12 @@ class ComprehensiveMemoryServerTest:
             
             # 4. 검색 테스트
             print("\nTesting Memory Search...")
-            await self.test_memory_search()
-            await self.test_multi_collection_search()
+            # 삽입이 끝난 뒤의 읽기 전용 검색은 서로 독립적이므로 동시에 실행
+            await asyncio.gather(self.test_memory_search(), self.test_multi_collection_search())
             
             # 5. 통계 테스트
             print("\nTesting Statistics...")
-            await self.test_user_statistics()
-            await self.test_system_statistics()
+            await asyncio.gather(self.test_user_statistics(), self.test_system_statistics())
             
             # 6. API 테스트
             print("\nTesting APIs...")
@@ -498,8 +503,13 @@ async def main():
     # 테스트 결과를 파일로 저장
     os.makedirs("test_reports", exist_ok=True)
     report_filename = f"test_reports/test_report_{int(time.time())}.json"
-    with open(report_filename, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson은 항상 UTF-8로 출력하므로 ensure_ascii=False와 같은 결과
+        with open(report_filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_filename, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     print(f"\nDetailed report saved to: {report_filename}")
     
@@ -508,4 +518,10 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # uvloop이 설치되어 있으면 더 빠른 이벤트 루프 사용
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file